@@ -234,5 +234,7 @@ function install() {
 // Export mergeSettings for test access (per spec testability section)
 module.exports = { mergeSettings };
 
-// Run installation
-install();
+// Run installation when invoked as a script, not when required for mergeSettings
+if (require.main === module) {
+  install();
+}
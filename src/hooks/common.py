@@ -5,7 +5,10 @@
 #       docs/reflector/spec.md, docs/dedup/spec.md
 # Contract: docs/sections/contract.md, docs/curator/contract.md, docs/retry/contract.md
 # Observability: docs/curator/observability.md, docs/retry/observability.md
+import collections
 import copy
+import functools
+import itertools
 import json
 import os
 import random
@@ -34,11 +37,19 @@ SECTION_SLUGS = {
     "OTHERS": "oth",
 }
 
+# Case-folded lookup for _resolve_section. Keyed by str.upper() (not lower())
+# so matching stays identical to comparing both sides upper-cased.
+_SECTION_CANONICAL = {sys.intern(name.upper()): sys.intern(name) for name in SECTION_SLUGS}
+
 # Retry configuration for extract_keypoints() API calls.
 # @implements REQ-RETRY-008
 MAX_RETRIES = 3    # Total attempts (0-indexed: attempt 0, 1, 2)
 BASE_DELAY = 2.0   # Base delay in seconds for exponential backoff
 
+# Maximum curator operations applied per extraction (CON-CUR-004).
+# @invariant INV-CUR-005
+MAX_OPS = 10
+
 
 def get_project_dir() -> Path:
     project_dir = os.getenv("CLAUDE_PROJECT_DIR")
@@ -64,8 +75,15 @@ def save_diagnostic(content: str, name: str):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filepath = diagnostic_dir / f"{timestamp}_{name}.txt"
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Raw fd write: diagnostics are small one-shot files, so skip the
+    # TextIOWrapper/BufferedWriter layers that open() builds per call
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def is_first_message(session_id: str) -> bool:
@@ -121,13 +139,38 @@ def generate_keypoint_name(section_entries: list[dict], slug: str) -> str:
     @implements REQ-SECT-002
     @invariant INV-SECT-005 (slug prefix consistency)
     """
+    return f"{slug}-{_max_keypoint_number(section_entries, slug) + 1:03d}"
+
+
+def _max_keypoint_number(section_entries: list[dict], slug: str) -> int:
+    """Return the highest NNN among {slug}-NNN names in section_entries (0 if none)."""
     pattern = re.compile(rf"^{re.escape(slug)}-(\d+)$")
     max_num = 0
     for entry in section_entries:
         match = pattern.match(entry.get("name", ""))
         if match:
             max_num = max(max_num, int(match.group(1)))
-    return f"{slug}-{max_num + 1:03d}"
+    return max_num
+
+
+def _next_keypoint_name(next_ids: dict[str, int], section_name: str, section_entries: list[dict]) -> str:
+    """Return the next key point name for section_name using a per-call counter.
+
+    next_ids maps canonical section name -> next NNN. A section's counter is
+    seeded on first use by scanning section_entries once (same rule as
+    generate_keypoint_name()); subsequent names are O(1) increments. Callers
+    create one next_ids dict per batch, so the counter never outlives the
+    playbook state it was seeded from.
+
+    @implements REQ-SECT-002
+    @invariant INV-SECT-005 (slug prefix consistency)
+    """
+    slug = SECTION_SLUGS[section_name]
+    num = next_ids.get(section_name)
+    if num is None:
+        num = _max_keypoint_number(section_entries, slug) + 1
+    next_ids[section_name] = num + 1
+    return f"{slug}-{num:03d}"
 
 
 def _generate_legacy_keypoint_name(existing_names: set) -> str:
@@ -170,11 +213,7 @@ def _resolve_section(section_name: str | None) -> str:
     """
     if not section_name or not section_name.strip():
         return "OTHERS"
-    stripped = section_name.strip()
-    for canonical in SECTION_SLUGS:
-        if canonical.upper() == stripped.upper():
-            return canonical
-    return "OTHERS"
+    return _SECTION_CANONICAL.get(section_name.strip().upper(), "OTHERS")
 
 
 def load_settings() -> dict:
@@ -324,8 +363,10 @@ def save_playbook(playbook: dict):
     playbook_path = get_project_dir() / ".claude" / "playbook.json"
 
     playbook_path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode in one call and write once: json.dump() streams every small
+    # chunk of the indented encoder through the file object separately.
     with open(playbook_path, "w", encoding="utf-8") as f:
-        json.dump(playbook, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(playbook, indent=2, ensure_ascii=False))
 
 
 def format_playbook(playbook: dict) -> str:
@@ -394,250 +435,408 @@ def apply_bullet_tags(playbook: dict, bullet_tags: list[dict]) -> dict:
     return playbook
 
 
-def _apply_curator_operations(playbook: dict, operations: list) -> dict:
-    """Apply curator operations (ADD, UPDATE, MERGE, DELETE) to the playbook.
+def _clone_playbook(playbook: dict) -> dict:
+    """Return an isolated copy of a sections-based playbook.
 
-    The playbook passed in is a deep copy -- mutations are safe.
-    Operations are applied sequentially in list order.
-    Invalid operations are skipped (no-op with diagnostic log).
+    Entries are flat {"name", "text", "helpful", "harmful"} dicts, so each is
+    copied with dict.copy(); an entry or top-level value holding a nested
+    container falls back to copy.deepcopy.
 
-    @implements REQ-CUR-002, REQ-CUR-003, REQ-CUR-004, REQ-CUR-005, REQ-CUR-009, REQ-CUR-013
-    @invariant INV-CUR-002 (no crash on invalid operations)
-    @invariant INV-CUR-004 (section names remain canonical)
-    @invariant INV-CUR-005 (operations bounded to 10)
-    @invariant INV-CUR-007 (UPDATE preserves entry identity)
-    @invariant INV-CUR-009 (UPDATE validates both fields)
+    @invariant INV-CUR-001, INV-CUR-010 (copy isolation)
     """
-    # @invariant INV-CUR-005: Truncate to CON-CUR-004 max
-    MAX_OPS = 10
-    truncated_from = None
-    if len(operations) > MAX_OPS:
-        truncated_from = len(operations)
-        if is_diagnostic_mode():
-            save_diagnostic(
-                f"Operations list truncated from {truncated_from} to {MAX_OPS}",
-                "curator_ops_truncated"
-            )
-        operations = operations[:MAX_OPS]
+    clone = {}
+    for key, value in playbook.items():
+        if key == "sections":
+            clone[key] = {
+                section_name: [
+                    copy.deepcopy(kp) if any(isinstance(v, (dict, list)) for v in kp.values())
+                    else kp.copy()
+                    for kp in entries
+                ]
+                for section_name, entries in value.items()
+            }
+        elif isinstance(value, (dict, list)):
+            clone[key] = copy.deepcopy(value)
+        else:
+            clone[key] = value
+    return clone
 
-    # Counters for OBS-CUR-001 summary
-    counts = {"ADD": 0, "UPDATE": 0, "MERGE": 0, "DELETE": 0}
-    skipped = {"ADD": 0, "UPDATE": 0, "MERGE": 0, "DELETE": 0, "unknown": 0}
-    skip_reasons = []
 
-    for op in operations:
-        op_type = op.get("type", "")
+def _build_text_counts(playbook: dict) -> collections.Counter:
+    """Count entry texts across all sections, skipping tombstoned (None) slots."""
+    return collections.Counter(
+        kp["text"]
+        for kp in itertools.chain.from_iterable(playbook["sections"].values())
+        if kp is not None
+    )
 
-        if op_type == "ADD":
-            # REQ-CUR-002: ADD operation
-            # @invariant INV-CUR-002: validate before applying
-            text = op.get("text", "")
-            if not text or not isinstance(text, str) or not text.strip():
-                skipped["ADD"] += 1
-                skip_reasons.append("ADD: empty or missing text")
-                continue
 
-            raw_section = op.get("section", "") or ""
-            # @invariant INV-CUR-004: section names remain canonical
-            section_name = _resolve_section(raw_section)
+def _build_name_index(playbook: dict) -> dict:
+    """Map entry name -> list of (section, position), in playbook scan order.
 
-            # Dedup against all existing texts across all sections
-            existing_texts = set()
-            for entries in playbook["sections"].values():
-                for kp in entries:
-                    existing_texts.add(kp["text"])
+    Legacy playbooks can repeat a name; every occurrence is kept so that
+    UPDATE/DELETE can use the first and MERGE the last, as a full scan would.
+    """
+    name_index = {}
+    for sec_name, entries in playbook["sections"].items():
+        for i, kp in enumerate(entries):
+            if kp is not None:
+                name_index.setdefault(kp.get("name"), []).append((sec_name, i))
+    return name_index
 
-            if text in existing_texts:
-                skipped["ADD"] += 1
-                skip_reasons.append(f"ADD: duplicate text \"{text[:40]}...\"")
-                continue
 
-            slug = SECTION_SLUGS[section_name]
-            target_entries = playbook["sections"][section_name]
-            name = generate_keypoint_name(target_entries, slug)
-            target_entries.append({"name": name, "text": text, "helpful": 0, "harmful": 0})
-            counts["ADD"] += 1
-
-        elif op_type == "MERGE":
-            # REQ-CUR-003: MERGE operation
-            source_ids = op.get("source_ids", [])
-            merged_text = op.get("merged_text", "")
-
-            # Validation (QG-CUR-001)
-            if not isinstance(source_ids, list) or len(source_ids) < 2:
-                skipped["MERGE"] += 1
-                skip_reasons.append("MERGE: source_ids has fewer than 2 entries")
-                continue
-            if not merged_text or not isinstance(merged_text, str) or not merged_text.strip():
-                skipped["MERGE"] += 1
-                skip_reasons.append("MERGE: empty or missing merged_text")
-                continue
+def _compact_section(playbook: dict, section_name: str, name_index: dict, tombstoned: set) -> None:
+    """Drop tombstoned (None) slots from a section and re-point its name_index entries.
 
-            # Build ID-to-entry and ID-to-section lookup from current state
-            id_to_entry = {}
-            id_to_section = {}
-            for sec_name, entries in playbook["sections"].items():
-                for kp in entries:
-                    id_to_entry[kp["name"]] = kp
-                    id_to_section[kp["name"]] = sec_name
-
-            # Filter valid source_ids
-            valid_ids = []
-            for sid in source_ids:
-                if sid in id_to_entry:
-                    valid_ids.append(sid)
-                else:
-                    # OBS-CUR-002 (LOG-CUR-002): non-existent ID
-                    if is_diagnostic_mode():
-                        save_diagnostic(
-                            f"MERGE references non-existent ID: {sid!r}",
-                            "curator_nonexistent_id"
-                        )
-                    skip_reasons.append(f"MERGE: source_id {sid!r} not found")
+    No-op if the section has no tombstones.
+    """
+    if section_name not in tombstoned:
+        return
+    tombstoned.discard(section_name)
+    entries = [kp for kp in playbook["sections"][section_name] if kp is not None]
+    playbook["sections"][section_name] = entries
+    new_positions = collections.defaultdict(list)
+    for i, kp in enumerate(entries):
+        new_positions[kp.get("name")].append(i)
+    # Survivors keep their relative order, so a name's locations in this
+    # section are re-pointed in sequence; other sections' locations are kept
+    for name, positions in new_positions.items():
+        remaining = iter(positions)
+        name_index[name] = [
+            (sec, next(remaining)) if sec == section_name else (sec, i)
+            for sec, i in name_index[name]
+        ]
+
+
+def _index_entry(playbook: dict, name_index: dict, name: str, section_name: str, pos: int) -> None:
+    """Record a newly appended entry, keeping the name's locations in scan order."""
+    order = list(playbook["sections"])
+    rank = (order.index(section_name), pos)
+    locs = name_index.setdefault(name, [])
+    at = len(locs)
+    while at and (order.index(locs[at - 1][0]), locs[at - 1][1]) > rank:
+        at -= 1
+    locs.insert(at, (section_name, pos))
+
+
+def _tombstone_name(playbook: dict, name: str, section_name: str, state: dict) -> None:
+    """Remove every entry called name from section_name (tombstone their slots)."""
+    name_index = state["name_index"]
+    text_counts = state["text_counts"]
+    kept = []
+    for sec, i in name_index[name]:
+        if sec != section_name:
+            kept.append((sec, i))
+            continue
+        if text_counts is not None:
+            text_counts[playbook["sections"][sec][i]["text"]] -= 1
+        playbook["sections"][sec][i] = None
+        state["tombstoned"].add(sec)
+    if kept:
+        name_index[name] = kept
+    else:
+        del name_index[name]
 
-            if len(valid_ids) < 2:
-                skipped["MERGE"] += 1
-                skip_reasons.append("MERGE: fewer than 2 valid source_ids remain after filtering")
-                continue
 
-            # Resolve target section
-            raw_section = op.get("section", "") or ""
-            if raw_section and raw_section.strip():
-                # @invariant INV-CUR-004: section names remain canonical
-                target_section = _resolve_section(raw_section)
-            else:
-                target_section = id_to_section[valid_ids[0]]  # section of first valid source
-
-            # @invariant INV-CUR-003: Sum counters from valid sources (non-negative preserved)
-            total_helpful = sum(id_to_entry[sid]["helpful"] for sid in valid_ids)
-            total_harmful = sum(id_to_entry[sid]["harmful"] for sid in valid_ids)
-
-            # Create new entry in target section
-            slug = SECTION_SLUGS[target_section]
-            target_entries = playbook["sections"][target_section]
-            name = generate_keypoint_name(target_entries, slug)
-            target_entries.append({
-                "name": name,
-                "text": merged_text,
-                "helpful": total_helpful,
-                "harmful": total_harmful,
-            })
-
-            # Remove all valid source entries from their sections
-            for sid in valid_ids:
-                sec = id_to_section[sid]
-                playbook["sections"][sec] = [
-                    kp for kp in playbook["sections"][sec] if kp["name"] != sid
-                ]
+def _curator_text_counts(playbook: dict, state: dict) -> collections.Counter:
+    """Return the batch's ADD dedup index, building it on first use."""
+    if state["text_counts"] is None:
+        state["text_counts"] = _build_text_counts(playbook)
+    return state["text_counts"]
 
-            counts["MERGE"] += 1
 
-        elif op_type == "UPDATE":
-            # REQ-CUR-013: UPDATE operation
-            # @invariant INV-CUR-009: validate both target_id and text
-            target_id = op.get("target_id", "")
-            text = op.get("text", "")
+def _curator_name_index(playbook: dict, state: dict) -> dict:
+    """Return the batch's name index, building it on first use."""
+    if state["name_index"] is None:
+        state["name_index"] = _build_name_index(playbook)
+    return state["name_index"]
 
-            if not target_id or not isinstance(target_id, str) or not target_id.strip():
-                skipped["UPDATE"] += 1
-                skip_reasons.append("UPDATE: empty or missing target_id")
-                continue
 
-            if not text or not isinstance(text, str) or not text.strip():
-                skipped["UPDATE"] += 1
-                skip_reasons.append("UPDATE: empty or missing text")
-                continue
+def _curator_add(playbook: dict, op: dict, state: dict) -> bool:
+    """Apply one ADD operation. Returns True if applied, False if skipped.
 
-            # Find the entry across all sections
-            found_entry = None
-            for sec_name, entries in playbook["sections"].items():
-                for kp in entries:
-                    if kp["name"] == target_id:
-                        found_entry = kp
-                        break
-                if found_entry:
-                    break
+    @implements REQ-CUR-002
+    @invariant INV-CUR-002 (validate before applying)
+    @invariant INV-CUR-004 (section names remain canonical)
+    """
+    skip_reasons = state["skip_reasons"]
+    text = op.get("text")
+    if not isinstance(text, str) or not text.strip():
+        skip_reasons.append("ADD: empty or missing text")
+        return False
+
+    raw_section = op.get("section") or ""
+    section_name = _resolve_section(raw_section)
+
+    # Dedup against all existing texts across all sections
+    text_counts = _curator_text_counts(playbook, state)
+    if text_counts[text] > 0:
+        skip_reasons.append(f"ADD: duplicate text \"{text[:40]}...\"")
+        return False
+
+    name_index = state["name_index"]
+    _compact_section(playbook, section_name, name_index, state["tombstoned"])
+    target_entries = playbook["sections"][section_name]
+    name = _next_keypoint_name(state["next_ids"], section_name, target_entries)
+    target_entries.append({"name": name, "text": text, "helpful": 0, "harmful": 0})
+    if name_index is not None:
+        _index_entry(playbook, name_index, name, section_name, len(target_entries) - 1)
+    text_counts[text] += 1
+    return True
 
-            if not found_entry:
-                skipped["UPDATE"] += 1
-                print(f"UPDATE: target_id {target_id!r} not found in playbook, skipping", file=sys.stderr)
-                # OBS-CUR-002: non-existent ID
-                if is_diagnostic_mode():
-                    save_diagnostic(
-                        f"UPDATE references non-existent ID: {target_id!r}",
-                        "curator_nonexistent_id"
-                    )
-                skip_reasons.append(f"UPDATE: target_id {target_id!r} not found")
-                continue
 
-            # @invariant INV-CUR-007: only text field is updated; name/helpful/harmful unchanged
-            old_text = found_entry["text"]
-            found_entry["text"] = text
+def _curator_merge(playbook: dict, op: dict, state: dict) -> bool:
+    """Apply one MERGE operation. Returns True if applied, False if skipped.
 
-            # OBS-CUR-004: UPDATE audit diagnostic
-            if is_diagnostic_mode():
+    @implements REQ-CUR-003
+    @invariant INV-CUR-003 (merged counters are sums of non-negative sources)
+    @invariant INV-CUR-004 (section names remain canonical)
+    """
+    skip_reasons = state["skip_reasons"]
+    source_ids = op.get("source_ids")
+    merged_text = op.get("merged_text")
+
+    # Validation (QG-CUR-001)
+    if not isinstance(source_ids, list) or len(source_ids) < 2:
+        skip_reasons.append("MERGE: source_ids has fewer than 2 entries")
+        return False
+    if not isinstance(merged_text, str) or not merged_text.strip():
+        skip_reasons.append("MERGE: empty or missing merged_text")
+        return False
+
+    name_index = _curator_name_index(playbook, state)
+
+    # Filter valid source_ids
+    valid_ids = []
+    for sid in source_ids:
+        if sid in name_index:
+            valid_ids.append(sid)
+        else:
+            # OBS-CUR-002 (LOG-CUR-002): non-existent ID
+            if state["diagnostic"]:
                 save_diagnostic(
-                    f"UPDATE applied: target_id={target_id!r}, "
-                    f"old_text=\"{old_text[:80]}\", new_text=\"{text[:80]}\"",
-                    "curator_update_audit"
+                    f"MERGE references non-existent ID: {sid!r}",
+                    "curator_nonexistent_id"
                 )
+            skip_reasons.append(f"MERGE: source_id {sid!r} not found")
 
-            counts["UPDATE"] += 1
+    if len(valid_ids) < 2:
+        skip_reasons.append("MERGE: fewer than 2 valid source_ids remain after filtering")
+        return False
 
-        elif op_type == "DELETE":
-            # REQ-CUR-004: DELETE operation
-            target_id = op.get("target_id", "")
-            reason = op.get("reason", "")
+    # Resolve target section
+    raw_section = op.get("section") or ""
+    if raw_section and raw_section.strip():
+        target_section = _resolve_section(raw_section)
+    else:
+        target_section = name_index[valid_ids[0]][-1][0]  # section of first valid source
+
+    # Sum counters from valid sources in a single pass. A duplicated name
+    # resolves to its last occurrence, and is removed from that section only.
+    total_helpful = total_harmful = 0
+    source_sections = {}
+    for sid in valid_ids:
+        sec, i = name_index[sid][-1]
+        source = playbook["sections"][sec][i]
+        total_helpful += source["helpful"]
+        total_harmful += source["harmful"]
+        source_sections[sid] = sec
+
+    # Create new entry in target section
+    tombstoned = state["tombstoned"]
+    text_counts = state["text_counts"]
+    _compact_section(playbook, target_section, name_index, tombstoned)
+    target_entries = playbook["sections"][target_section]
+    name = _next_keypoint_name(state["next_ids"], target_section, target_entries)
+    target_entries.append({
+        "name": name,
+        "text": merged_text,
+        "helpful": total_helpful,
+        "harmful": total_harmful,
+    })
+    _index_entry(playbook, name_index, name, target_section, len(target_entries) - 1)
+    if text_counts is not None:
+        text_counts[merged_text] += 1
+
+    # Tombstone all valid source entries (a repeated source_id is removed once)
+    for sid, sec in source_sections.items():
+        _tombstone_name(playbook, sid, sec, state)
+    return True
 
-            if not target_id or not isinstance(target_id, str) or not target_id.strip():
-                skipped["DELETE"] += 1
-                skip_reasons.append("DELETE: empty or missing target_id")
-                continue
 
-            # Find the entry
-            found_section = None
-            found_entry = None
-            for sec_name, entries in playbook["sections"].items():
-                for kp in entries:
-                    if kp["name"] == target_id:
-                        found_section = sec_name
-                        found_entry = kp
-                        break
-                if found_section:
-                    break
+def _curator_update(playbook: dict, op: dict, state: dict) -> bool:
+    """Apply one UPDATE operation. Returns True if applied, False if skipped.
 
-            if not found_section:
-                skipped["DELETE"] += 1
-                # OBS-CUR-002 (LOG-CUR-002): non-existent ID
-                if is_diagnostic_mode():
-                    save_diagnostic(
-                        f"DELETE references non-existent ID: {target_id!r}",
-                        "curator_nonexistent_id"
-                    )
-                skip_reasons.append(f"DELETE: target_id {target_id!r} not found")
-                continue
+    @implements REQ-CUR-013
+    @invariant INV-CUR-007 (only the text field changes)
+    @invariant INV-CUR-009 (validates both target_id and text)
+    """
+    skip_reasons = state["skip_reasons"]
+    target_id = op.get("target_id")
+    text = op.get("text")
+
+    if not isinstance(target_id, str) or not target_id.strip():
+        skip_reasons.append("UPDATE: empty or missing target_id")
+        return False
+
+    if not isinstance(text, str) or not text.strip():
+        skip_reasons.append("UPDATE: empty or missing text")
+        return False
+
+    # Find the entry across all sections
+    locs = _curator_name_index(playbook, state).get(target_id)
+    found_entry = playbook["sections"][locs[0][0]][locs[0][1]] if locs else None
+
+    if not found_entry:
+        print(f"UPDATE: target_id {target_id!r} not found in playbook, skipping", file=sys.stderr)
+        # OBS-CUR-002: non-existent ID
+        if state["diagnostic"]:
+            save_diagnostic(
+                f"UPDATE references non-existent ID: {target_id!r}",
+                "curator_nonexistent_id"
+            )
+        skip_reasons.append(f"UPDATE: target_id {target_id!r} not found")
+        return False
+
+    old_text = found_entry["text"]
+    found_entry["text"] = text
+    text_counts = state["text_counts"]
+    if text_counts is not None:
+        text_counts[old_text] -= 1
+        text_counts[text] += 1
+
+    # OBS-CUR-004: UPDATE audit diagnostic
+    if state["diagnostic"]:
+        save_diagnostic(
+            f"UPDATE applied: target_id={target_id!r}, "
+            f"old_text=\"{old_text[:80]}\", new_text=\"{text[:80]}\"",
+            "curator_update_audit"
+        )
+    return True
 
-            # OBS-CUR-003 (LOG-CUR-003): DELETE reason audit
-            if is_diagnostic_mode() and found_entry is not None:
-                save_diagnostic(
-                    f"DELETE applied: target_id={target_id!r}, "
-                    f"text=\"{found_entry['text'][:80]}\", "
-                    f"reason={reason!r}",
-                    "curator_delete_audit"
-                )
 
-            # Remove entry
-            playbook["sections"][found_section] = [
-                kp for kp in playbook["sections"][found_section] if kp["name"] != target_id
-            ]
-            counts["DELETE"] += 1
+def _curator_delete(playbook: dict, op: dict, state: dict) -> bool:
+    """Apply one DELETE operation. Returns True if applied, False if skipped.
 
-        else:
+    @implements REQ-CUR-004
+    """
+    skip_reasons = state["skip_reasons"]
+    target_id = op.get("target_id")
+    reason = op.get("reason", "")
+
+    if not isinstance(target_id, str) or not target_id.strip():
+        skip_reasons.append("DELETE: empty or missing target_id")
+        return False
+
+    # Find the entry
+    name_index = _curator_name_index(playbook, state)
+    locs = name_index.get(target_id)
+    if locs is None:
+        # OBS-CUR-002 (LOG-CUR-002): non-existent ID
+        if state["diagnostic"]:
+            save_diagnostic(
+                f"DELETE references non-existent ID: {target_id!r}",
+                "curator_nonexistent_id"
+            )
+        skip_reasons.append(f"DELETE: target_id {target_id!r} not found")
+        return False
+
+    found_section, found_pos = locs[0]
+    found_entry = playbook["sections"][found_section][found_pos]
+
+    # OBS-CUR-003 (LOG-CUR-003): DELETE reason audit
+    if state["diagnostic"]:
+        save_diagnostic(
+            f"DELETE applied: target_id={target_id!r}, "
+            f"text=\"{found_entry['text'][:80]}\", "
+            f"reason={reason!r}",
+            "curator_delete_audit"
+        )
+
+    # Remove every entry with that name from its section (tombstone;
+    # compacted at the end of the batch)
+    _tombstone_name(playbook, target_id, found_section, state)
+    return True
+
+
+# Operation type -> handler. Types not listed here are skipped as unknown.
+_CURATOR_OP_HANDLERS = {
+    "ADD": _curator_add,
+    "MERGE": _curator_merge,
+    "UPDATE": _curator_update,
+    "DELETE": _curator_delete,
+}
+
+
+def _apply_curator_operations(playbook: dict, operations: list) -> dict:
+    """Apply curator operations (ADD, UPDATE, MERGE, DELETE) to the playbook.
+
+    The playbook passed in is a deep copy -- mutations are safe.
+    Operations are applied sequentially in list order, each dispatched to its
+    handler via _CURATOR_OP_HANDLERS.
+    Invalid operations are skipped (no-op with diagnostic log).
+
+    @implements REQ-CUR-002, REQ-CUR-003, REQ-CUR-004, REQ-CUR-005, REQ-CUR-009, REQ-CUR-013
+    @invariant INV-CUR-002 (no crash on invalid operations)
+    @invariant INV-CUR-004 (section names remain canonical)
+    @invariant INV-CUR-005 (operations bounded to 10)
+    @invariant INV-CUR-007 (UPDATE preserves entry identity)
+    @invariant INV-CUR-009 (UPDATE validates both fields)
+    """
+    # @invariant INV-CUR-005: Only the first CON-CUR-004 max ops are ever looked at
+    # (the dispatch loop iterates an islice; no truncated copy is built)
+    truncated_from = len(operations) if len(operations) > MAX_OPS else None
+    diagnostic = is_diagnostic_mode()
+    if truncated_from is not None and diagnostic:
+        save_diagnostic(
+            f"Operations list truncated from {truncated_from} to {MAX_OPS}",
+            "curator_ops_truncated"
+        )
+
+    # Counters for OBS-CUR-001 summary
+    counts = {"ADD": 0, "UPDATE": 0, "MERGE": 0, "DELETE": 0}
+    skipped = {"ADD": 0, "UPDATE": 0, "MERGE": 0, "DELETE": 0, "unknown": 0}
+    skip_reasons = []
+
+    # Per-batch state shared by the handlers.
+    # Both indexes are built lazily, on the first op that needs them, from the
+    # playbook state at that point; once built they are kept in step with every
+    # mutation. A single-op batch therefore builds at most one of them.
+    state = {
+        # Global ADD dedup index. A Counter (not a set) so that removing one of
+        # two entries sharing a text does not unblock that text for a later ADD.
+        "text_counts": None,
+        # name -> [(section, position), ...]. Removed entries are tombstoned (slot set
+        # to None) and their section compacted lazily -- before the section is
+        # appended to, and once at the end.
+        "name_index": None,
+        "tombstoned": set(),
+        # Per-section next NNN, seeded on first use (see _next_keypoint_name)
+        "next_ids": {},
+        "skip_reasons": skip_reasons,
+        # is_diagnostic_mode() stats a flag file; resolve it once per batch
+        "diagnostic": diagnostic,
+    }
+
+    for op in itertools.islice(operations, MAX_OPS):
+        # A non-dict op is skipped like an unknown type, not left to raise and
+        # roll back the whole batch
+        op_type = op.get("type", "") if isinstance(op, dict) else None
+        handler = _CURATOR_OP_HANDLERS.get(op_type) if isinstance(op_type, str) else None
+        if handler is None:
             skipped["unknown"] += 1
             skip_reasons.append(f"Unknown operation type: {op_type!r}")
+        elif handler(playbook, op, state):
+            counts[op_type] += 1
+        else:
+            skipped[op_type] += 1
+
+    tombstoned = state["tombstoned"]
+    for section_name in list(tombstoned):
+        _compact_section(playbook, section_name, state["name_index"], tombstoned)
 
     # OBS-CUR-001 (LOG-CUR-001): Summary diagnostic
-    if is_diagnostic_mode():
+    if diagnostic:
         summary_parts = ["Curator operations summary:"]
         if truncated_from is not None:
             summary_parts.append(f"  Operations list truncated from {truncated_from} to {MAX_OPS}")
@@ -658,9 +857,9 @@ def _apply_curator_operations(playbook: dict, operations: list) -> dict:
 def apply_structured_operations(playbook: dict, operations: list[dict]) -> dict:
     """Apply structured curator operations to the playbook with deep copy isolation.
 
-    If operations is empty, returns the original playbook unmodified (no deepcopy).
-    Otherwise, creates a deep copy, applies operations via _apply_curator_operations(),
-    and returns the modified copy. On exception, returns the original playbook.
+    If operations is empty, returns the original playbook unmodified (no copy).
+    Otherwise, creates a deep copy via _clone_playbook(), applies operations via
+    _apply_curator_operations(), and returns the modified copy. On exception, returns the original playbook.
 
     @implements REQ-CUR-014
     @invariant INV-CUR-010 (deep copy isolation)
@@ -669,7 +868,7 @@ def apply_structured_operations(playbook: dict, operations: list[dict]) -> dict:
         return playbook
 
     try:
-        playbook_copy = copy.deepcopy(playbook)
+        playbook_copy = _clone_playbook(playbook)
         playbook_copy = _apply_curator_operations(playbook_copy, operations)
         return playbook_copy
     except Exception:
@@ -682,6 +881,31 @@ def apply_structured_operations(playbook: dict, operations: list[dict]) -> dict:
         return playbook
 
 
+def _is_prunable(kp: dict) -> bool:
+    """Pruning threshold: harmful >= 3 AND harmful > helpful."""
+    harmful = kp.get("harmful", 0)
+    return harmful >= 3 and harmful > kp.get("helpful", 0)
+
+
+def _prune_sections(sections: dict) -> list:
+    """Drop prunable entries from each section in place; return the pruned entries.
+
+    A section with nothing to prune keeps its existing list (no rebuild).
+    """
+    pruned_entries = []
+    for section_name, entries in sections.items():
+        if not any(_is_prunable(kp) for kp in entries):
+            continue
+        surviving = []
+        for kp in entries:
+            if _is_prunable(kp):
+                pruned_entries.append(kp)
+            else:
+                surviving.append(kp)
+        sections[section_name] = surviving
+    return pruned_entries
+
+
 def prune_harmful(playbook: dict) -> dict:
     """Remove key points where harmful >= 3 AND harmful > helpful.
 
@@ -691,17 +915,7 @@ def prune_harmful(playbook: dict) -> dict:
     @implements REQ-CUR-015
     @invariant INV-CUR-011 (thresholds identical to baseline)
     """
-    pruned_entries = []
-    for section_name in playbook.get("sections", {}):
-        surviving = []
-        for kp in playbook["sections"][section_name]:
-            harmful = kp.get("harmful", 0)
-            helpful = kp.get("helpful", 0)
-            if harmful >= 3 and harmful > helpful:
-                pruned_entries.append(kp)
-            else:
-                surviving.append(kp)
-        playbook["sections"][section_name] = surviving
+    pruned_entries = _prune_sections(playbook.get("sections", {}))
 
     if pruned_entries:
         for kp in pruned_entries:
@@ -726,6 +940,56 @@ def prune_harmful(playbook: dict) -> dict:
     return playbook
 
 
+def _apply_new_key_points(playbook: dict, new_key_points: list) -> None:
+    """Insert legacy new_key_points into their resolved sections, in place.
+
+    Only used when the extraction has no "operations" key (CON-CUR-001).
+
+    @implements REQ-SECT-005
+    @invariant INV-SECT-005 (section-slug ID prefix consistency)
+    """
+    # Collect all existing texts across all sections for dedup
+    existing_texts = {
+        kp["text"] for kp in itertools.chain.from_iterable(playbook["sections"].values())
+    }
+
+    # REQ-SECT-005: New key point insertion with section resolution
+    next_ids = {}
+    for item in new_key_points:
+        # Backward compat: plain string -> {"text": str, "section": "OTHERS"}
+        # (SCN-SECT-004-03)
+        if isinstance(item, str):
+            text = item
+            section_name = "OTHERS"
+        elif isinstance(item, dict):
+            text = item.get("text", "")
+            raw_section = item.get("section", "") or ""
+            section_name = _resolve_section(raw_section)
+            # LOG-SECT-002: Unknown section fallback diagnostic
+            # Only emitted for non-empty strings that don't match canonical names
+            # (SCN-SECT-004-05: missing/None/empty do NOT trigger this)
+            if section_name == "OTHERS" and raw_section and raw_section.strip():
+                # Check if the resolved "OTHERS" was due to unknown name vs. explicit "OTHERS"
+                stripped_upper = raw_section.strip().upper()
+                if stripped_upper != "OTHERS":
+                    if is_diagnostic_mode():
+                        save_diagnostic(
+                            f"Unknown section '{raw_section}' for key point: \"{text[:80]}\". "
+                            f"Assigned to OTHERS.",
+                            "sections_unknown_section"
+                        )
+        else:
+            continue  # Skip invalid entry types
+
+        if not text or text in existing_texts:
+            continue
+
+        target_entries = playbook["sections"][section_name]
+        name = _next_keypoint_name(next_ids, section_name, target_entries)
+        target_entries.append({"name": name, "text": text, "helpful": 0, "harmful": 0})
+        existing_texts.add(text)
+
+
 def update_playbook_data(playbook: dict, extraction_result: dict) -> dict:
     """Apply operations or new_key_points, evaluations, and pruning across all sections.
 
@@ -745,7 +1009,7 @@ def update_playbook_data(playbook: dict, extraction_result: dict) -> dict:
         if isinstance(operations, list) and operations:
             try:
                 # @invariant INV-CUR-001: deep copy isolation
-                playbook_copy = copy.deepcopy(playbook)
+                playbook_copy = _clone_playbook(playbook)
                 playbook = _apply_curator_operations(playbook_copy, operations)
             except Exception:
                 # INV-CUR-001: rollback to original on uncaught exception
@@ -760,57 +1024,16 @@ def update_playbook_data(playbook: dict, extraction_result: dict) -> dict:
     else:
         # Backward compat: use new_key_points as before (CON-CUR-001)
         new_key_points = extraction_result.get("new_key_points", [])
-
-        # Collect all existing texts across all sections for dedup
-        existing_texts = set()
-        for entries in playbook["sections"].values():
-            for kp in entries:
-                existing_texts.add(kp["text"])
-
-        # REQ-SECT-005: New key point insertion with section resolution
-        for item in new_key_points:
-            # Backward compat: plain string -> {"text": str, "section": "OTHERS"}
-            # (SCN-SECT-004-03)
-            if isinstance(item, str):
-                text = item
-                section_name = "OTHERS"
-            elif isinstance(item, dict):
-                text = item.get("text", "")
-                raw_section = item.get("section", "") or ""
-                section_name = _resolve_section(raw_section)
-                # LOG-SECT-002: Unknown section fallback diagnostic
-                # Only emitted for non-empty strings that don't match canonical names
-                # (SCN-SECT-004-05: missing/None/empty do NOT trigger this)
-                if section_name == "OTHERS" and raw_section and raw_section.strip():
-                    # Check if the resolved "OTHERS" was due to unknown name vs. explicit "OTHERS"
-                    stripped_upper = raw_section.strip().upper()
-                    if stripped_upper != "OTHERS":
-                        if is_diagnostic_mode():
-                            save_diagnostic(
-                                f"Unknown section '{raw_section}' for key point: \"{text[:80]}\". "
-                                f"Assigned to OTHERS.",
-                                "sections_unknown_section"
-                            )
-            else:
-                continue  # Skip invalid entry types
-
-            if not text or text in existing_texts:
-                continue
-
-            slug = SECTION_SLUGS[section_name]
-            target_entries = playbook["sections"][section_name]
-            name = generate_keypoint_name(target_entries, slug)
-            target_entries.append({"name": name, "text": text, "helpful": 0, "harmful": 0})
-            existing_texts.add(text)
+        if new_key_points:
+            _apply_new_key_points(playbook, new_key_points)
 
     evaluations = extraction_result.get("evaluations", [])
 
     # REQ-SECT-008: Evaluations across ALL sections
-    # Build name-to-keypoint lookup across ALL sections
-    name_to_kp = {}
-    for entries in playbook["sections"].values():
-        for kp in entries:
-            name_to_kp[kp["name"]] = kp
+    # Build name-to-keypoint lookup across ALL sections (only if there is anything to score)
+    name_to_kp = {
+        kp["name"]: kp for kp in itertools.chain.from_iterable(playbook["sections"].values())
+    } if evaluations else {}
 
     for eval_item in evaluations:
         name = eval_item.get("name", "")
@@ -825,17 +1048,7 @@ def update_playbook_data(playbook: dict, extraction_result: dict) -> dict:
 
     # REQ-SECT-008: Pruning across ALL sections
     # @invariant INV-SCORE-003: Zero-evaluation entries (helpful=0, harmful=0) are never pruned
-    pruned_entries = []
-    for section_name in playbook["sections"]:
-        surviving = []
-        for kp in playbook["sections"][section_name]:
-            harmful = kp.get("harmful", 0)
-            helpful = kp.get("helpful", 0)
-            if harmful >= 3 and harmful > helpful:
-                pruned_entries.append(kp)
-            else:
-                surviving.append(kp)
-        playbook["sections"][section_name] = surviving
+    pruned_entries = _prune_sections(playbook["sections"])
 
     # LOG-SCORE-002: Diagnostic logging for pruning
     if pruned_entries and is_diagnostic_mode():
@@ -903,12 +1116,18 @@ def load_transcript(transcript_path: str) -> list[dict]:
     return conversations
 
 
-def load_template(template_name: str) -> str:
-    template_path = get_user_claude_dir() / "prompts" / template_name
+@functools.lru_cache(maxsize=16)
+def _read_template(template_path: Path, mtime_ns: int) -> str:
+    """Read a template file; cached per (path, mtime) so edits are still picked up."""
     with open(template_path, "r", encoding="utf-8") as f:
         return f.read()
 
 
+def load_template(template_name: str) -> str:
+    template_path = get_user_claude_dir() / "prompts" / template_name
+    return _read_template(template_path, template_path.stat().st_mtime_ns)
+
+
 def _extract_json_robust(response_text: str) -> dict | None:
     """Attempt to extract JSON from LLM response using 4 strategies.
 
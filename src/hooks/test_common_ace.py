@@ -2123,6 +2123,56 @@ class TestReflectorTxtTemplate(unittest.TestCase):
         assert '"name"' in template
 
 
+class TestLoadTemplateCache(unittest.TestCase):
+    """White-box tests for the per-(path, mtime) template read cache."""
+
+    def test_repeat_load_served_from_cache_and_edit_invalidates(self):
+        """Unchanged template is read once; rewriting it with a new mtime re-reads."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            prompts = Path(tmp) / "prompts"
+            prompts.mkdir()
+            template_path = prompts / "cache_probe.txt"
+            template_path.write_text("v1 {playbook}", encoding="utf-8")
+
+            with patch("common.get_user_claude_dir", return_value=Path(tmp)):
+                common._read_template.cache_clear()
+                assert common.load_template("cache_probe.txt") == "v1 {playbook}"
+                assert common.load_template("cache_probe.txt") == "v1 {playbook}"
+                info = common._read_template.cache_info()
+                assert (info.misses, info.hits) == (1, 1)
+
+                template_path.write_text("v2 {playbook}", encoding="utf-8")
+                st = template_path.stat()
+                os.utime(template_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+                assert common.load_template("cache_probe.txt") == "v2 {playbook}"
+
+    def test_missing_template_raises(self):
+        """A missing template still raises FileNotFoundError."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("common.get_user_claude_dir", return_value=Path(tmp)):
+                with self.assertRaises(FileNotFoundError):
+                    common.load_template("nope.txt")
+
+
+class TestSaveDiagnostic(unittest.TestCase):
+    """White-box tests for the raw-fd diagnostic writer."""
+
+    def test_writes_utf8_and_truncates_on_rewrite(self):
+        """Content round-trips as UTF-8; rewriting the same file drops the old tail."""
+        import tempfile
+        fixed_now = MagicMock()
+        fixed_now.now.return_value.strftime.return_value = "20260101_000000"
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("common.get_project_dir", return_value=Path(tmp)), \
+                 patch("common.datetime", fixed_now):
+                common.save_diagnostic("a much longer first version \u2014 caf\u00e9", "probe")
+                common.save_diagnostic("caf\u00e9", "probe")
+            written = Path(tmp) / ".claude" / "diagnostic" / "20260101_000000_probe.txt"
+            assert written.read_text(encoding="utf-8") == "caf\u00e9"
+
+
 # ===========================================================================
 # F6: REQ-CUR-008 -- operations vs new_key_points precedence tests
 # ===========================================================================
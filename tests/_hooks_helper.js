@@ -0,0 +1,148 @@
+// Node worker for tests/test_hooks_whitebox.py.
+//
+// Usage: node _hooks_helper.js <path/to/install.js> <reply fd>
+//
+// Reads one JSON request per stdin line and writes one JSON reply per line
+// to <reply fd>, a pipe inherited from the test process. Replies do not use
+// stdout: install() runs `uv sync` with inherited stdio, and that output
+// must not interleave with them.
+//
+// Requests:
+//   {op: "merge", home, src, uv, project, destContent}
+//     A non-null destContent is written to $HOME/.claude/settings.json,
+//     then mergeSettings() runs and its result is the reply.
+//   {op: "install", env}
+//     install() runs in this process with process.env replaced by env; the
+//     reply is {returncode, stdout, stderr} as `node install.js` would
+//     produce. No child process exists: process.exit is stubbed to record
+//     the code and throw an ExitSignal that unwinds install(), so returncode
+//     is synthesized from the first exit() call (0 if install() returns).
+//
+// install.js is read and compiled once; each request re-runs its module
+// body so that the module-level home-derived paths follow the request's
+// HOME. install() runs only when install.js is the main module, so merge
+// requests re-run the body with no side effects and install requests
+// present their module as require.main.
+
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const util = require('util');
+const vm = require('vm');
+const Module = require('module');
+const INSTALL_JS = process.argv[2];
+const REPLY_FD = Number(process.argv[3]);
+
+// Every test merges from the project's src/settings.json template, which
+// does not change during a run; read it from disk once and serve the
+// cached text afterwards.
+const SRC_SETTINGS = path.join(path.dirname(INSTALL_JS), 'src', 'settings.json');
+const readFileSync = fs.readFileSync;
+let srcSettingsText = null;
+fs.readFileSync = function(file, options) {
+  if (file === SRC_SETTINGS && options === 'utf-8') {
+    if (srcSettingsText === null) {
+      srcSettingsText = readFileSync(file, options);
+    }
+    return srcSettingsText;
+  }
+  return readFileSync.apply(this, arguments);
+};
+
+// Blank the shebang line as Node's own loader does; line numbers in
+// stack traces stay aligned with the file.
+const source = readFileSync(INSTALL_JS, 'utf-8').replace(/^#!.*/, '');
+const script = new vm.Script(Module.wrap(source), { filename: INSTALL_JS });
+const installRequire = Module.createRequire(INSTALL_JS);
+
+function runModule(asMain) {
+  const mod = { exports: {} };
+  const moduleRequire = (id) => installRequire(id);
+  Object.assign(moduleRequire, installRequire);
+  moduleRequire.main = asMain ? mod : undefined;
+  script.runInThisContext()(
+    mod.exports, moduleRequire, mod, INSTALL_JS, path.dirname(INSTALL_JS),
+  );
+  return mod.exports;
+}
+
+function merge(req) {
+  if (req.destContent != null) {
+    const claudeDir = path.join(req.home, '.claude');
+    fs.mkdirSync(claudeDir, { recursive: true });
+    fs.writeFileSync(path.join(claudeDir, 'settings.json'), req.destContent);
+  }
+  process.env.HOME = req.home;
+  process.env.USERPROFILE = req.home;
+  return runModule(false).mergeSettings(req.src, req.uv, req.project);
+}
+
+// Thrown by the stubbed process.exit to unwind install()
+class ExitSignal {}
+
+function replaceEnv(env) {
+  // Mutate the real process.env: os.homedir() and execSync read the
+  // process environment, not a substituted object.
+  for (const key of Object.keys(process.env)) {
+    delete process.env[key];
+  }
+  Object.assign(process.env, env);
+}
+
+function install(req) {
+  const savedEnv = { ...process.env };
+  const saved = {
+    exit: process.exit,
+    stdoutWrite: process.stdout.write,
+    stderrWrite: process.stderr.write,
+  };
+  const stdout = [];
+  const stderr = [];
+  let returncode = null;
+
+  // A real process is gone after its first exit(); drop whatever
+  // install()'s catch block prints while the stub unwinds it.
+  process.stdout.write = function(chunk) {
+    if (returncode === null) stdout.push(String(chunk));
+    return true;
+  };
+  process.stderr.write = function(chunk) {
+    if (returncode === null) stderr.push(String(chunk));
+    return true;
+  };
+  process.exit = function(code) {
+    if (returncode === null) returncode = code === undefined ? 0 : code;
+    throw new ExitSignal();
+  };
+
+  replaceEnv(req.env);
+  try {
+    runModule(true);
+  } catch (e) {
+    if (!(e instanceof ExitSignal) && returncode === null) {
+      stderr.push(util.format(e) + '\n');
+      returncode = 1;
+    }
+  } finally {
+    replaceEnv(savedEnv);
+    process.exit = saved.exit;
+    process.stdout.write = saved.stdoutWrite;
+    process.stderr.write = saved.stderrWrite;
+  }
+  return {
+    returncode: returncode === null ? 0 : returncode,
+    stdout: stdout.join(''),
+    stderr: stderr.join(''),
+  };
+}
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+  const req = JSON.parse(line);
+  let result;
+  try {
+    result = req.op === 'install' ? install(req) : merge(req);
+  } catch (e) {
+    result = { __error__: e.message };
+  }
+  fs.writeSync(REPLY_FD, JSON.stringify(result) + '\n');
+});
@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures.
+
+Per-module fixtures (project_dir, playbook_path, diagnostic helpers) stay in
+their test files; only fixtures that are genuinely cross-module live here.
+"""
+
+import asyncio
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.hooks.common as _common_module
+
+
+@pytest.fixture(scope="session")
+def session_event_loop():
+    """One event loop for the whole run.
+
+    asyncio.run() builds and tears down a fresh loop (selector, default
+    executor) on every call; extraction tests reuse this one instead.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run_async(session_event_loop):
+    """Run a coroutine to completion on the shared session loop."""
+    return session_event_loop.run_until_complete
+
+
+@pytest.fixture
+def anthropic_mocks(monkeypatch):
+    """Set up all mocks needed to call extract_keypoints() without a real LLM.
+
+    Mocks are built fresh for every test, so nothing a test configures on them
+    carries over. Returns (mock_client, mock_text_block) so callers can set
+    mock_text_block.text.
+    """
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("AGENTIC_CONTEXT_MODEL", "claude-test")
+    monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", True)
+    monkeypatch.setattr(
+        _common_module,
+        "load_template",
+        lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
+    )
+
+    mock_response = MagicMock()
+    mock_text_block = MagicMock()
+    mock_text_block.type = "text"
+    mock_text_block.text = '{"new_key_points": [], "evaluations": []}'
+    mock_response.content = [mock_text_block]
+
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = mock_response
+
+    mock_anthropic_cls = MagicMock(return_value=mock_client)
+    fake_anthropic = ModuleType("anthropic")
+    setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
+    monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
+
+    return mock_client, mock_text_block
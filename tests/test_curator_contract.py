@@ -9,12 +9,9 @@ They do NOT reference internal branches, implementation details, or design.md.
 They verify only behaviors promised by the data contracts.
 """
 
-import asyncio
 import copy
 import json
 import sys
-from types import ModuleType
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -35,37 +32,6 @@ from src.hooks.common import (
 # ---------------------------------------------------------------------------
 
 
-def _setup_extract_keypoints_mocks(monkeypatch):
-    """Set up all mocks needed to call extract_keypoints() without a real LLM.
-
-    Returns (mock_client, mock_text_block) so callers can set mock_text_block.text.
-    """
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-    monkeypatch.setenv("AGENTIC_CONTEXT_MODEL", "claude-test")
-    monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", True)
-    monkeypatch.setattr(
-        _common_module,
-        "load_template",
-        lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
-    )
-
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = '{"new_key_points": [], "evaluations": []}'
-    mock_response.content = [mock_text_block]
-
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
-
-    mock_anthropic_cls = MagicMock(return_value=mock_client)
-    fake_anthropic = ModuleType("anthropic")
-    setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
-    monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
-
-    return mock_client, mock_text_block
-
-
 def _make_sections_playbook(sections_dict=None):
     """Construct a sections-based playbook per contract.md schema."""
     sections = {name: [] for name in SECTION_SLUGS}
@@ -74,6 +40,11 @@ def _make_sections_playbook(sections_dict=None):
     return {"version": "1.0", "last_updated": None, "sections": sections}
 
 
+def _by_name(section):
+    """Index a section's entries by name for O(1) lookups in assertions."""
+    return {kp["name"]: kp for kp in section}
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -94,15 +65,15 @@ def project_dir(tmp_path, monkeypatch):
 
 
 # @tests-contract REQ-CUR-001
-def test_contract_extraction_includes_operations(monkeypatch):
+def test_contract_extraction_includes_operations(anthropic_mocks, run_async):
     """Contract: extract_keypoints returns operations when present in LLM response."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "evaluations": [{"name": "pat-001", "rating": "helpful"}],
         "operations": [{"type": "ADD", "text": "new insight", "section": "OTHERS"}],
     })
     playbook = _make_sections_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Contract: operations key present with the list from LLM
     assert "operations" in result
@@ -113,15 +84,15 @@ def test_contract_extraction_includes_operations(monkeypatch):
 
 
 # @tests-contract REQ-CUR-001
-def test_contract_extraction_omits_operations_when_absent(monkeypatch):
+def test_contract_extraction_omits_operations_when_absent(anthropic_mocks, run_async):
     """Contract: extract_keypoints omits operations key when LLM does not return it."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "new_key_points": ["some point"],
         "evaluations": [],
     })
     playbook = _make_sections_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Contract: operations key absent
     assert "operations" not in result
@@ -130,15 +101,15 @@ def test_contract_extraction_omits_operations_when_absent(monkeypatch):
 
 
 # @tests-contract REQ-CUR-001
-def test_contract_extraction_non_list_operations_treated_as_absent(monkeypatch):
+def test_contract_extraction_non_list_operations_treated_as_absent(anthropic_mocks, run_async):
     """Contract: non-list operations value treated as if key were absent."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "evaluations": [],
         "operations": None,
     })
     playbook = _make_sections_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Contract: operations key absent for non-list value
     assert "operations" not in result
@@ -623,9 +594,9 @@ def test_contract_full_lifecycle_operations(project_dir):
 
     # Contract: MERGE created merged entry, removed sources
     assert "use types and dataclasses" in pat_texts
-    pat_names = [kp["name"] for kp in pat]
-    assert "pat-001" not in pat_names
-    assert "pat-002" not in pat_names
+    pat_by_name = _by_name(pat)
+    assert "pat-001" not in pat_by_name
+    assert "pat-002" not in pat_by_name
 
     # Contract: merged entry has summed counters
     merged = next(kp for kp in pat if kp["text"] == "use types and dataclasses")
@@ -636,8 +607,7 @@ def test_contract_full_lifecycle_operations(project_dir):
     assert len(result["sections"]["MISTAKES TO AVOID"]) == 0
 
     # Contract: evaluations applied
-    oth_001 = next(kp for kp in result["sections"]["OTHERS"] if kp["name"] == "oth-001")
-    assert oth_001["helpful"] == 2
+    assert _by_name(result["sections"]["OTHERS"])["oth-001"]["helpful"] == 2
 
     # Contract: new_key_points ignored
     all_texts = set()
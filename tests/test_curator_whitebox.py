@@ -7,12 +7,11 @@ Covers all REQ-CUR-001 through REQ-CUR-009, all 32 SCN-CUR-* scenarios,
 all 6 INV-CUR-* invariants, and LOG-CUR-001/002/003 instrumentation tests.
 """
 
-import asyncio
 import copy
+import itertools
 import json
+import shutil
 import sys
-from types import ModuleType
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -23,6 +22,7 @@ import src.hooks.common as _common_module
 
 from src.hooks.common import (
     SECTION_SLUGS,
+    _clone_playbook,
     _default_playbook,
     extract_keypoints,
     update_playbook_data,
@@ -34,35 +34,7 @@ from src.hooks.common import (
 # ---------------------------------------------------------------------------
 
 
-def _setup_extract_keypoints_mocks(monkeypatch):
-    """Set up all mocks needed to call extract_keypoints() without a real LLM.
-
-    Returns (mock_client, mock_text_block) so callers can set mock_text_block.text.
-    """
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-    monkeypatch.setenv("AGENTIC_CONTEXT_MODEL", "claude-test")
-    monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", True)
-    monkeypatch.setattr(
-        _common_module,
-        "load_template",
-        lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
-    )
-
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = '{"new_key_points": [], "evaluations": []}'
-    mock_response.content = [mock_text_block]
-
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
-
-    mock_anthropic_cls = MagicMock(return_value=mock_client)
-    fake_anthropic = ModuleType("anthropic")
-    setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
-    monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
-
-    return mock_client, mock_text_block
+_CANONICAL_SECTION_SET = frozenset(SECTION_SLUGS)
 
 
 def _make_playbook(sections_dict=None):
@@ -74,6 +46,13 @@ def _make_playbook(sections_dict=None):
     return {"version": "1.0", "last_updated": None, "sections": sections}
 
 
+# Twenty distinct OTHERS ADDs, built once. Truncation tests slice a prefix;
+# the curator only reads ops, so the dicts are safe to share across tests.
+_ADD_OPS_OTHERS = tuple(
+    {"type": "ADD", "text": f"entry {i}", "section": "OTHERS"} for i in range(20)
+)
+
+
 def _make_extraction(operations=None, new_key_points=None, evaluations=None):
     """Construct an extraction_result dict with operations support."""
     result = {"evaluations": evaluations or []}
@@ -86,21 +65,33 @@ def _make_extraction(operations=None, new_key_points=None, evaluations=None):
     return result
 
 
+def _iter_entries(playbook):
+    """Lazily yield every entry across all sections (for any()/next() checks)."""
+    return itertools.chain.from_iterable(playbook["sections"].values())
+
+
 def _collect_all_entries(playbook):
     """Flatten all entries from all sections into a single list."""
-    entries = []
-    for section_entries in playbook["sections"].values():
-        entries.extend(section_entries)
-    return entries
+    return list(_iter_entries(playbook))
 
 
 def _collect_all_texts(playbook):
     """Collect all entry texts from all sections into a set."""
-    texts = set()
-    for section_entries in playbook["sections"].values():
-        for kp in section_entries:
-            texts.add(kp["text"])
-    return texts
+    return {kp["text"] for kp in _iter_entries(playbook)}
+
+
+def _by_name(section):
+    """Index a section's entries by name for O(1) lookups in assertions."""
+    return {kp["name"]: kp for kp in section}
+
+
+def _contains_value(obj, needle):
+    """True if any string value nested in obj contains needle (short-circuits)."""
+    if isinstance(obj, dict):
+        return any(_contains_value(v, needle) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_contains_value(v, needle) for v in obj)
+    return isinstance(obj, str) and needle in obj
 
 
 # ---------------------------------------------------------------------------
@@ -108,13 +99,28 @@ def _collect_all_texts(playbook):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def _shared_project_root(tmp_path_factory):
+    """One temp project directory for the whole module (created once)."""
+    root = tmp_path_factory.mktemp("curator_project")
+    (root / ".claude").mkdir()
+    return root
+
+
 @pytest.fixture
-def project_dir(tmp_path, monkeypatch):
-    """Set CLAUDE_PROJECT_DIR to a temp directory and create .claude/ structure."""
-    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
-    claude_dir = tmp_path / ".claude"
-    claude_dir.mkdir(parents=True, exist_ok=True)
-    return tmp_path
+def project_dir(_shared_project_root, monkeypatch):
+    """Set CLAUDE_PROJECT_DIR to the shared temp project with .claude/ structure.
+
+    Tests keep their playbooks in memory; the only on-disk state is the
+    diagnostic flag and diagnostic output, so .claude/ is emptied on teardown.
+    """
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(_shared_project_root))
+    yield _shared_project_root
+    for child in (_shared_project_root / ".claude").iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
 
 
 @pytest.fixture
@@ -139,15 +145,15 @@ def diagnostic_dir(project_dir):
 
 
 # @tests REQ-CUR-001
-def test_extract_keypoints_returns_operations(monkeypatch):
+def test_extract_keypoints_returns_operations(anthropic_mocks, run_async):
     """extract_keypoints returns operations when LLM response includes them."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "evaluations": [{"name": "pat-001", "rating": "helpful"}],
         "operations": [{"type": "ADD", "text": "new insight", "section": "OTHERS"}],
     })
     playbook = _make_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
     assert "operations" in result
     assert len(result["operations"]) == 1
     assert result["operations"][0]["type"] == "ADD"
@@ -156,53 +162,53 @@ def test_extract_keypoints_returns_operations(monkeypatch):
 
 
 # @tests SCN-CUR-001-01
-def test_scn_extract_operations_present(monkeypatch):
+def test_scn_extract_operations_present(anthropic_mocks, run_async):
     """SCN-CUR-001-01: LLM returns operations and evaluations."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "evaluations": [{"name": "pat-001", "rating": "helpful"}],
         "operations": [{"type": "ADD", "text": "new insight", "section": "PATTERNS & APPROACHES"}],
     })
     playbook = _make_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
     assert result["evaluations"] == [{"name": "pat-001", "rating": "helpful"}]
     assert result["operations"] == [{"type": "ADD", "text": "new insight", "section": "PATTERNS & APPROACHES"}]
 
 
 # @tests SCN-CUR-001-02
-def test_scn_extract_empty_operations(monkeypatch):
+def test_scn_extract_empty_operations(anthropic_mocks, run_async):
     """SCN-CUR-001-02: LLM returns empty operations list."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "evaluations": [{"name": "pat-001", "rating": "helpful"}],
         "operations": [],
     })
     playbook = _make_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
     assert "operations" in result
     assert result["operations"] == []
     assert result["evaluations"] == [{"name": "pat-001", "rating": "helpful"}]
 
 
 # @tests SCN-CUR-001-03
-def test_scn_extract_no_operations_key(monkeypatch):
+def test_scn_extract_no_operations_key(anthropic_mocks, run_async):
     """SCN-CUR-001-03: LLM returns old format without operations key."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     mock_text_block.text = json.dumps({
         "new_key_points": ["some new point"],
         "evaluations": [{"name": "pat-001", "rating": "helpful"}],
     })
     playbook = _make_playbook()
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
     assert "operations" not in result
     assert result["new_key_points"] == ["some new point"]
     assert result["evaluations"] == [{"name": "pat-001", "rating": "helpful"}]
 
 
 # @tests SCN-CUR-001-04
-def test_scn_extract_non_list_operations(monkeypatch):
+def test_scn_extract_non_list_operations(anthropic_mocks, run_async):
     """SCN-CUR-001-04: LLM returns non-list operations (null, string, int)."""
-    mock_client, mock_text_block = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, mock_text_block = anthropic_mocks
     playbook = _make_playbook()
 
     for non_list_value in [None, "not a list", 42, {}, True]:
@@ -210,7 +216,7 @@ def test_scn_extract_non_list_operations(monkeypatch):
             "evaluations": [{"name": "pat-001", "rating": "helpful"}],
             "operations": non_list_value,
         })
-        result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+        result = run_async(extract_keypoints(messages=[], playbook=playbook))
         assert "operations" not in result, (
             f"operations key should be absent for non-list value {non_list_value!r}"
         )
@@ -290,6 +296,34 @@ def test_scn_add_skips_duplicate_text(project_dir):
     assert len(result["sections"]["OTHERS"]) == 1
 
 
+# @tests SCN-CUR-002-03
+def test_add_dedup_tracks_earlier_ops_in_batch(project_dir):
+    """ADD dedup sees texts freed or introduced by earlier ops in the same batch,
+    and a text held by two entries stays blocked after only one is deleted."""
+    playbook = _make_playbook({
+        "PATTERNS & APPROACHES": [
+            {"name": "pat-001", "text": "deleted text", "helpful": 0, "harmful": 0},
+            {"name": "pat-002", "text": "old wording", "helpful": 0, "harmful": 0},
+        ],
+        "OTHERS": [
+            {"name": "kpt_001", "text": "shared text", "helpful": 0, "harmful": 0},
+            {"name": "kpt_002", "text": "shared text", "helpful": 0, "harmful": 0},
+        ],
+    })
+    extraction = _make_extraction(operations=[
+        {"type": "DELETE", "target_id": "pat-001", "reason": "stale"},
+        {"type": "UPDATE", "target_id": "pat-002", "text": "new wording"},
+        {"type": "DELETE", "target_id": "kpt_001", "reason": "dup"},
+        {"type": "ADD", "text": "deleted text", "section": "OTHERS"},
+        {"type": "ADD", "text": "old wording", "section": "OTHERS"},
+        {"type": "ADD", "text": "new wording", "section": "OTHERS"},
+        {"type": "ADD", "text": "shared text", "section": "OTHERS"},
+    ])
+    result = update_playbook_data(playbook, extraction)
+    oth_texts = [kp["text"] for kp in result["sections"]["OTHERS"]]
+    assert oth_texts == ["shared text", "deleted text", "old wording"]
+
+
 # @tests SCN-CUR-002-04
 def test_scn_add_skips_empty_text(project_dir):
     """SCN-CUR-002-04: ADD with empty text is skipped."""
@@ -370,6 +404,26 @@ def test_scn_merge_combines_two_entries(project_dir):
     assert merged["harmful"] == 1
 
 
+# @tests REQ-CUR-003
+def test_merge_appends_to_end_of_target_section(project_dir):
+    """MERGE appends the merged entry after the surviving entries (it does not
+    take over a source's slot); survivors keep their relative order."""
+    playbook = _make_playbook({
+        "PATTERNS & APPROACHES": [
+            {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0},
+            {"name": "pat-002", "text": "B", "helpful": 1, "harmful": 0},
+            {"name": "pat-003", "text": "C", "helpful": 1, "harmful": 0},
+            {"name": "pat-004", "text": "D", "helpful": 1, "harmful": 0},
+        ],
+    })
+    extraction = _make_extraction(operations=[
+        {"type": "MERGE", "source_ids": ["pat-001", "pat-003"], "merged_text": "AC"},
+    ])
+    result = update_playbook_data(playbook, extraction)
+    names = [kp["name"] for kp in result["sections"]["PATTERNS & APPROACHES"]]
+    assert names == ["pat-002", "pat-004", "pat-005"]
+
+
 # @tests SCN-CUR-003-02
 def test_scn_merge_explicit_section_override(project_dir):
     """SCN-CUR-003-02: MERGE with explicit section override places entry there."""
@@ -523,6 +577,51 @@ def test_scn_merge_first_source_deleted_by_prior_op(project_dir):
     assert merged["harmful"] == 0
 
 
+# @tests REQ-CUR-003, REQ-CUR-004, REQ-CUR-013
+def test_name_index_stays_valid_across_removals(project_dir):
+    """Lookups by name stay correct after earlier DELETE/MERGE ops in the same
+    section, and no removed slots survive in the returned playbook."""
+    playbook = _make_playbook({
+        "PATTERNS & APPROACHES": [
+            {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0},
+            {"name": "pat-002", "text": "B", "helpful": 1, "harmful": 0},
+            {"name": "pat-003", "text": "C", "helpful": 1, "harmful": 0},
+            {"name": "pat-004", "text": "D", "helpful": 1, "harmful": 0},
+        ],
+    })
+    extraction = _make_extraction(operations=[
+        {"type": "DELETE", "target_id": "pat-001", "reason": "obsolete"},
+        {"type": "MERGE", "source_ids": ["pat-002", "pat-003"], "merged_text": "BC"},
+        {"type": "UPDATE", "target_id": "pat-004", "text": "D2"},
+        {"type": "ADD", "text": "E", "section": "PATTERNS & APPROACHES"},
+        {"type": "DELETE", "target_id": "pat-005", "reason": "undo merge"},
+    ])
+    result = update_playbook_data(playbook, extraction)
+    pat = result["sections"]["PATTERNS & APPROACHES"]
+    assert None not in pat
+    assert [(kp["name"], kp["text"]) for kp in pat] == [
+        ("pat-004", "D2"),
+        ("pat-006", "E"),
+    ]
+
+
+# @tests REQ-CUR-002
+def test_add_never_reissues_name_within_batch(project_dir):
+    """A name minted earlier in the batch is not handed out again, even if the
+    entry holding it was deleted by a later op."""
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-001", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    extraction = _make_extraction(operations=[
+        {"type": "ADD", "text": "first", "section": "OTHERS"},
+        {"type": "DELETE", "target_id": "oth-002", "reason": "changed mind"},
+        {"type": "ADD", "text": "second", "section": "OTHERS"},
+    ])
+    result = update_playbook_data(playbook, extraction)
+    names = [kp["name"] for kp in result["sections"]["OTHERS"]]
+    assert names == ["oth-001", "oth-003"]
+
+
 # @tests SCN-CUR-003-08
 def test_scn_merge_all_source_ids_nonexistent(project_dir):
     """SCN-CUR-003-08: MERGE skipped when all source_ids are non-existent."""
@@ -545,6 +644,35 @@ def test_scn_merge_all_source_ids_nonexistent(project_dir):
     assert pat[0]["helpful"] == 5
 
 
+# @tests REQ-CUR-003
+def test_merge_duplicate_source_name_uses_last_occurrence(project_dir):
+    """A duplicated legacy source name resolves to its last occurrence: its
+    counters are summed and every entry with that name in that section is
+    removed; the same name in an earlier section survives."""
+    playbook = _make_playbook({
+        "MISTAKES TO AVOID": [
+            {"name": "oth-001", "text": "misfiled", "helpful": 9, "harmful": 9},
+        ],
+        "OTHERS": [
+            {"name": "oth-001", "text": "first copy", "helpful": 1, "harmful": 0},
+            {"name": "oth-001", "text": "second copy", "helpful": 4, "harmful": 1},
+            {"name": "oth-002", "text": "other", "helpful": 2, "harmful": 0},
+        ],
+    })
+    extraction = _make_extraction(
+        operations=[{
+            "type": "MERGE",
+            "source_ids": ["oth-001", "oth-002"],
+            "merged_text": "combined",
+        }]
+    )
+    result = update_playbook_data(playbook, extraction)
+    others = result["sections"]["OTHERS"]
+    assert [kp["text"] for kp in others] == ["combined"]
+    assert (others[0]["helpful"], others[0]["harmful"]) == (6, 1)
+    assert [kp["text"] for kp in result["sections"]["MISTAKES TO AVOID"]] == ["misfiled"]
+
+
 # ===========================================================================
 # REQ-CUR-004: DELETE Operation
 # ===========================================================================
@@ -565,6 +693,28 @@ def test_delete_removes_entry(project_dir):
     assert len(result["sections"]["MISTAKES TO AVOID"]) == 0
 
 
+# @tests REQ-CUR-004
+def test_delete_duplicate_name_removes_all_in_section(project_dir):
+    """DELETE of a duplicated legacy name removes every entry with that name
+    from the section of its first occurrence; later sections are untouched."""
+    playbook = _make_playbook({
+        "MISTAKES TO AVOID": [
+            {"name": "mis-001", "text": "first copy", "helpful": 0, "harmful": 2},
+            {"name": "mis-002", "text": "keep me", "helpful": 0, "harmful": 0},
+            {"name": "mis-001", "text": "second copy", "helpful": 0, "harmful": 1},
+        ],
+        "OTHERS": [
+            {"name": "mis-001", "text": "misfiled", "helpful": 0, "harmful": 0},
+        ],
+    })
+    extraction = _make_extraction(
+        operations=[{"type": "DELETE", "target_id": "mis-001", "reason": "obsolete"}]
+    )
+    result = update_playbook_data(playbook, extraction)
+    assert [kp["name"] for kp in result["sections"]["MISTAKES TO AVOID"]] == ["mis-002"]
+    assert [kp["text"] for kp in result["sections"]["OTHERS"]] == ["misfiled"]
+
+
 # @tests SCN-CUR-004-01
 def test_scn_delete_removes_entry(project_dir):
     """SCN-CUR-004-01: DELETE removes entry from section."""
@@ -887,7 +1037,76 @@ def test_scn_empty_operations_list_nkp_still_ignored(project_dir):
     result = update_playbook_data(playbook, extraction)
     all_texts = _collect_all_texts(result)
     assert "should not be added" not in all_texts
-    assert len(_collect_all_entries(result)) == 0
+    assert next(_iter_entries(result), None) is None
+
+
+# @tests SCN-CUR-008-03
+def test_empty_operations_skips_copy_and_apply(project_dir, monkeypatch):
+    """Empty operations list never copies the playbook or enters the apply loop;
+    evaluations still land on the (uncopied) input playbook."""
+    def _fail(*args, **kwargs):
+        raise AssertionError("should not be called for empty operations")
+
+    monkeypatch.setattr(_common_module, "_apply_curator_operations", _fail)
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-001", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    extraction = _make_extraction(
+        operations=[],
+        evaluations=[{"name": "oth-001", "rating": "helpful"}],
+    )
+    result = update_playbook_data(playbook, extraction)
+    assert result is playbook
+    assert result["sections"]["OTHERS"][0]["helpful"] == 1
+
+
+# @tests REQ-CUR-002
+def test_single_add_skips_name_index(project_dir, monkeypatch):
+    """A lone ADD applies without building the name index."""
+    def _fail(playbook):
+        raise AssertionError("name index should not be built for a lone ADD")
+
+    monkeypatch.setattr(_common_module, "_build_name_index", _fail)
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-001", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    result = update_playbook_data(playbook, _make_extraction(
+        operations=[{"type": "ADD", "text": "added", "section": "OTHERS"}]
+    ))
+    assert [kp["name"] for kp in result["sections"]["OTHERS"]] == ["oth-001", "oth-002"]
+
+
+# @tests REQ-CUR-004
+def test_single_delete_skips_text_index(project_dir, monkeypatch):
+    """A lone DELETE applies without building the ADD dedup text index."""
+    def _fail(playbook):
+        raise AssertionError("text index should not be built for a lone DELETE")
+
+    monkeypatch.setattr(_common_module, "_build_text_counts", _fail)
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-001", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    result = update_playbook_data(playbook, _make_extraction(
+        operations=[{"type": "DELETE", "target_id": "oth-001", "reason": "stale"}]
+    ))
+    assert result["sections"]["OTHERS"] == []
+
+
+# @tests-instrumentation LOG-CUR-001, LOG-CUR-002
+def test_diagnostic_flag_checked_once_per_batch(project_dir, monkeypatch):
+    """The diagnostic flag file is stat'ed once per batch, not once per op."""
+    calls = []
+    monkeypatch.setattr(_common_module, "is_diagnostic_mode", lambda: calls.append(1) or False)
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-001", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    _common_module._apply_curator_operations(playbook, [
+        {"type": "ADD", "text": "new", "section": "OTHERS"},
+        {"type": "DELETE", "target_id": "oth-404", "reason": "missing"},
+        {"type": "DELETE", "target_id": "oth-001", "reason": "stale"},
+        {"type": "MERGE", "source_ids": ["oth-404", "oth-405"], "merged_text": "x"},
+    ])
+    assert len(calls) == 1
 
 
 # ===========================================================================
@@ -899,7 +1118,7 @@ def test_scn_empty_operations_list_nkp_still_ignored(project_dir):
 def test_operations_truncated_to_10(project_dir):
     """Operations list truncated to first 10."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"entry {i}", "section": "OTHERS"} for i in range(15)]
+    ops = list(_ADD_OPS_OTHERS[:15])
     extraction = _make_extraction(operations=ops)
     result = update_playbook_data(playbook, extraction)
     oth = result["sections"]["OTHERS"]
@@ -910,7 +1129,7 @@ def test_operations_truncated_to_10(project_dir):
 def test_scn_operations_truncated_15_to_10(project_dir):
     """SCN-CUR-009-01: 15 operations truncated to 10."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"entry {i}", "section": "OTHERS"} for i in range(15)]
+    ops = list(_ADD_OPS_OTHERS[:15])
     extraction = _make_extraction(operations=ops)
     result = update_playbook_data(playbook, extraction)
     oth = result["sections"]["OTHERS"]
@@ -945,7 +1164,7 @@ def test_scn_unknown_operation_type_skipped(project_dir):
 def test_scn_exactly_10_operations_no_truncation(project_dir):
     """SCN-CUR-009-03: Exactly 10 operations processed without truncation."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"entry {i}", "section": "OTHERS"} for i in range(10)]
+    ops = list(_ADD_OPS_OTHERS[:10])
     extraction = _make_extraction(operations=ops)
     result = update_playbook_data(playbook, extraction)
     oth = result["sections"]["OTHERS"]
@@ -956,7 +1175,7 @@ def test_scn_exactly_10_operations_no_truncation(project_dir):
 def test_scn_exactly_11_operations_truncation(project_dir):
     """SCN-CUR-009-04: Exactly 11 operations truncated to 10."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"entry {i}", "section": "OTHERS"} for i in range(11)]
+    ops = list(_ADD_OPS_OTHERS[:11])
     extraction = _make_extraction(operations=ops)
     result = update_playbook_data(playbook, extraction)
     oth = result["sections"]["OTHERS"]
@@ -997,6 +1216,29 @@ def test_invariant_deep_copy_isolation(project_dir):
     assert playbook["sections"]["PATTERNS & APPROACHES"] == original_copy["sections"]["PATTERNS & APPROACHES"]
 
 
+# @tests-invariant INV-CUR-001
+def test_clone_playbook_isolates_entries():
+    """_clone_playbook copies sections, entries, and nested entry values."""
+    playbook = _make_playbook({
+        "PATTERNS & APPROACHES": [
+            {"name": "pat-001", "text": "flat", "helpful": 1, "harmful": 0},
+        ],
+        "OTHERS": [
+            {"name": "kpt_001", "text": "legacy", "helpful": 0, "harmful": 0, "tags": ["a"]},
+        ],
+    })
+    original_copy = copy.deepcopy(playbook)
+
+    clone = _clone_playbook(playbook)
+    assert clone == playbook
+    clone["sections"]["PATTERNS & APPROACHES"][0]["text"] = "changed"
+    clone["sections"]["PATTERNS & APPROACHES"].append({"name": "pat-002"})
+    clone["sections"]["OTHERS"][0]["tags"].append("b")
+    clone["version"] = "2.0"
+
+    assert playbook == original_copy
+
+
 # ===========================================================================
 # INV-CUR-002: No Crash on Invalid Operations
 # ===========================================================================
@@ -1071,7 +1313,6 @@ def test_invariant_counter_non_negativity_through_merge(project_dir):
 # @tests-invariant INV-CUR-004
 def test_invariant_section_names_canonical_after_ops(project_dir):
     """After operations, all section keys are canonical."""
-    canonical_set = set(SECTION_SLUGS.keys())
     playbook = _make_playbook({
         "PATTERNS & APPROACHES": [
             {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0},
@@ -1090,7 +1331,7 @@ def test_invariant_section_names_canonical_after_ops(project_dir):
         ]
     )
     result = update_playbook_data(playbook, extraction)
-    assert set(result["sections"].keys()) == canonical_set
+    assert set(result["sections"].keys()) == _CANONICAL_SECTION_SET
 
 
 # ===========================================================================
@@ -1102,7 +1343,7 @@ def test_invariant_section_names_canonical_after_ops(project_dir):
 def test_invariant_operations_bounded_to_10(project_dir):
     """At most 10 operations are processed."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"item {i}", "section": "OTHERS"} for i in range(20)]
+    ops = list(_ADD_OPS_OTHERS[:20])
     extraction = _make_extraction(operations=ops)
     result = update_playbook_data(playbook, extraction)
     oth = result["sections"]["OTHERS"]
@@ -1134,125 +1375,63 @@ def test_invariant_precedence_prevents_double_processing(project_dir):
 # ===========================================================================
 
 
-# @tests REQ-CUR-002, REQ-CUR-009 (TC-INVAL-002)
-def test_tc_inval_002_add_text_none(project_dir):
-    """TC-INVAL-002: ADD with text=None is skipped."""
-    playbook = _make_playbook()
-    extraction = _make_extraction(
-        operations=[{"type": "ADD", "text": None, "section": "OTHERS"}]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(result["sections"]["OTHERS"]) == 0
-
-
-# @tests REQ-CUR-002, REQ-CUR-009 (TC-INVAL-003)
-def test_tc_inval_003_add_missing_text_key(project_dir):
-    """TC-INVAL-003: ADD with missing text key is skipped."""
-    playbook = _make_playbook()
-    extraction = _make_extraction(
-        operations=[{"type": "ADD", "section": "OTHERS"}]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(result["sections"]["OTHERS"]) == 0
-
-
-# @tests REQ-CUR-003, REQ-CUR-009 (TC-INVAL-004)
-def test_tc_inval_004_merge_source_ids_string(project_dir):
-    """TC-INVAL-004: MERGE with source_ids as string (not list) is skipped."""
-    playbook = _make_playbook({
-        "PATTERNS & APPROACHES": [
-            {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0},
-        ],
-    })
-    extraction = _make_extraction(
-        operations=[{
-            "type": "MERGE",
-            "source_ids": "pat-001",
-            "merged_text": "combined",
-        }]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(result["sections"]["PATTERNS & APPROACHES"]) == 1
-
-
-# @tests REQ-CUR-003, REQ-CUR-009 (TC-INVAL-006)
-def test_tc_inval_006_merge_empty_merged_text(project_dir):
-    """TC-INVAL-006: MERGE with empty merged_text is skipped."""
-    playbook = _make_playbook({
-        "PATTERNS & APPROACHES": [
-            {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0},
-            {"name": "pat-002", "text": "B", "helpful": 1, "harmful": 0},
-        ],
-    })
-    extraction = _make_extraction(
-        operations=[{
-            "type": "MERGE",
-            "source_ids": ["pat-001", "pat-002"],
-            "merged_text": "",
-        }]
-    )
-    result = update_playbook_data(playbook, extraction)
-    # MERGE skipped: both entries still present
-    assert len(result["sections"]["PATTERNS & APPROACHES"]) == 2
-
-
-# @tests REQ-CUR-004, REQ-CUR-009 (TC-INVAL-008)
-def test_tc_inval_008_delete_target_id_none(project_dir):
-    """TC-INVAL-008: DELETE with target_id=None is skipped."""
-    playbook = _make_playbook({
-        "OTHERS": [
-            {"name": "oth-001", "text": "keep me", "helpful": 0, "harmful": 0},
-        ],
-    })
-    extraction = _make_extraction(
-        operations=[{"type": "DELETE", "target_id": None, "reason": "cleanup"}]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(result["sections"]["OTHERS"]) == 1
+_PAT_A = {"name": "pat-001", "text": "A", "helpful": 1, "harmful": 0}
+_PAT_B = {"name": "pat-002", "text": "B", "helpful": 1, "harmful": 0}
+_OTH_KEEP = {"name": "oth-001", "text": "keep me", "helpful": 0, "harmful": 0}
+
+# (seed sections, single invalid op). Every case must leave the playbook unchanged.
+_TC_INVAL_SINGLE_OP_CASES = {
+    # TC-INVAL-002: ADD with text=None
+    "TC-INVAL-002": ({}, {"type": "ADD", "text": None, "section": "OTHERS"}),
+    # TC-INVAL-003: ADD with missing text key
+    "TC-INVAL-003": ({}, {"type": "ADD", "section": "OTHERS"}),
+    # TC-INVAL-004: MERGE with source_ids as string (not list)
+    "TC-INVAL-004": (
+        {"PATTERNS & APPROACHES": [_PAT_A]},
+        {"type": "MERGE", "source_ids": "pat-001", "merged_text": "combined"},
+    ),
+    # TC-INVAL-006: MERGE with empty merged_text
+    "TC-INVAL-006": (
+        {"PATTERNS & APPROACHES": [_PAT_A, _PAT_B]},
+        {"type": "MERGE", "source_ids": ["pat-001", "pat-002"], "merged_text": ""},
+    ),
+    # TC-INVAL-008: DELETE with target_id=None
+    "TC-INVAL-008": (
+        {"OTHERS": [_OTH_KEEP]},
+        {"type": "DELETE", "target_id": None, "reason": "cleanup"},
+    ),
+    # TC-INVAL-016: ADD with whitespace-only text
+    "TC-INVAL-016": ({}, {"type": "ADD", "text": "   ", "section": "OTHERS"}),
+    # TC-INVAL-015: MERGE with empty source_ids list
+    "TC-INVAL-015": ({}, {"type": "MERGE", "source_ids": [], "merged_text": "combined"}),
+}
+
+
+# @tests REQ-CUR-002, REQ-CUR-003, REQ-CUR-004, REQ-CUR-009
+# (TC-INVAL-002, TC-INVAL-003, TC-INVAL-004, TC-INVAL-006, TC-INVAL-008, TC-INVAL-015, TC-INVAL-016)
+@pytest.mark.parametrize(
+    "seed,op", _TC_INVAL_SINGLE_OP_CASES.values(), ids=_TC_INVAL_SINGLE_OP_CASES.keys()
+)
+def test_tc_inval_single_op_skipped(project_dir, seed, op):
+    """TC-INVAL-*: a single malformed op is skipped and the playbook is unchanged."""
+    playbook = _make_playbook(copy.deepcopy(seed))
+    result = update_playbook_data(playbook, _make_extraction(operations=[op]))
+    assert result["sections"] == _make_playbook(seed)["sections"]
 
 
 # @tests REQ-CUR-009, INV-CUR-002 (TC-INVAL-011)
 def test_tc_inval_011_non_dict_operation(project_dir):
-    """TC-INVAL-011: A non-dict operation does not crash update_playbook_data."""
+    """TC-INVAL-011: A non-dict operation is skipped; the rest of the batch applies."""
     playbook = _make_playbook({
         "OTHERS": [
             {"name": "oth-001", "text": "keep me", "helpful": 0, "harmful": 0},
         ],
     })
-    # Non-dict in operations list: string "ADD" triggers AttributeError on .get()
-    # This should be caught by the try/except rollback
     extraction = _make_extraction(
         operations=["ADD", {"type": "ADD", "text": "valid", "section": "OTHERS"}]
     )
     result = update_playbook_data(playbook, extraction)
-    # Due to rollback, original entry should still be present
-    assert any(kp["text"] == "keep me" for kp in result["sections"]["OTHERS"])
-
-
-# @tests REQ-CUR-002, REQ-CUR-009 (TC-INVAL-016)
-def test_tc_inval_016_add_whitespace_only_text(project_dir):
-    """TC-INVAL-016: ADD with whitespace-only text is skipped."""
-    playbook = _make_playbook()
-    extraction = _make_extraction(
-        operations=[{"type": "ADD", "text": "   ", "section": "OTHERS"}]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(result["sections"]["OTHERS"]) == 0
-
-
-# @tests REQ-CUR-003, REQ-CUR-009 (TC-INVAL-015)
-def test_tc_inval_015_merge_empty_source_ids_list(project_dir):
-    """TC-INVAL-015: MERGE with empty source_ids list is skipped."""
-    playbook = _make_playbook()
-    extraction = _make_extraction(
-        operations=[{
-            "type": "MERGE",
-            "source_ids": [],
-            "merged_text": "combined",
-        }]
-    )
-    result = update_playbook_data(playbook, extraction)
-    assert len(_collect_all_entries(result)) == 0
+    assert [kp["text"] for kp in result["sections"]["OTHERS"]] == ["keep me", "valid"]
 
 
 # ===========================================================================
@@ -1353,8 +1532,7 @@ def test_tc_integ_008_delete_reason_not_stored(project_dir):
     )
     result = update_playbook_data(playbook, extraction)
     # The reason should not appear anywhere in the playbook
-    playbook_json = json.dumps(result)
-    assert "secret reason" not in playbook_json
+    assert not _contains_value(result, "secret reason")
 
 
 # ===========================================================================
@@ -1376,8 +1554,7 @@ def test_tc_compat_004_evaluations_work_after_operations(project_dir):
     }
     result = update_playbook_data(playbook, extraction)
     # oth-001 should have incremented helpful
-    oth_001 = next(kp for kp in result["sections"]["OTHERS"] if kp["name"] == "oth-001")
-    assert oth_001["helpful"] == 1
+    assert _by_name(result["sections"]["OTHERS"])["oth-001"]["helpful"] == 1
 
 
 # @tests REQ-CUR-006 (TC-COMPAT-005)
@@ -1426,10 +1603,10 @@ def test_instrumentation_ops_summary_created(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_ops_summary.txt"))
-    assert len(files) >= 1, "Curator ops summary diagnostic not created"
+    first = next(diagnostic_dir.glob("*_curator_ops_summary.txt"), None)
+    assert first is not None, "Curator ops summary diagnostic not created"
 
-    content = files[0].read_text()
+    content = first.read_text()
     assert "ADD" in content
     assert "DELETE" in content
     assert "applied" in content
@@ -1447,8 +1624,9 @@ def test_instrumentation_ops_summary_not_created_when_disabled(project_dir):
 
     diag_dir = project_dir / ".claude" / "diagnostic"
     if diag_dir.exists():
-        files = list(diag_dir.glob("*_curator_ops_summary.txt"))
-        assert len(files) == 0, "Summary diagnostic created when disabled"
+        assert not any(diag_dir.glob("*_curator_ops_summary.txt")), (
+            "Summary diagnostic created when disabled"
+        )
 
 
 # @tests-instrumentation LOG-CUR-001
@@ -1457,14 +1635,14 @@ def test_instrumentation_truncation_diagnostic_created(
 ):
     """Diagnostic mode on + 15 operations -> truncation diagnostic created."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"e{i}", "section": "OTHERS"} for i in range(15)]
+    ops = list(_ADD_OPS_OTHERS[:15])
     extraction = _make_extraction(operations=ops)
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_ops_truncated.txt"))
-    assert len(files) >= 1, "Truncation diagnostic not created"
+    first = next(diagnostic_dir.glob("*_curator_ops_truncated.txt"), None)
+    assert first is not None, "Truncation diagnostic not created"
 
-    content = files[0].read_text()
+    content = first.read_text()
     assert "15" in content
     assert "10" in content
 
@@ -1475,12 +1653,13 @@ def test_instrumentation_truncation_not_emitted_at_10(
 ):
     """Diagnostic mode on + exactly 10 operations -> no truncation diagnostic."""
     playbook = _make_playbook()
-    ops = [{"type": "ADD", "text": f"e{i}", "section": "OTHERS"} for i in range(10)]
+    ops = list(_ADD_OPS_OTHERS[:10])
     extraction = _make_extraction(operations=ops)
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_ops_truncated.txt"))
-    assert len(files) == 0, "Truncation diagnostic created at exactly 10 (should not)"
+    assert not any(diagnostic_dir.glob("*_curator_ops_truncated.txt")), (
+        "Truncation diagnostic created at exactly 10 (should not)"
+    )
 
 
 # ===========================================================================
@@ -1508,10 +1687,10 @@ def test_instrumentation_nonexistent_id_merge(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_nonexistent_id.txt"))
-    assert len(files) >= 1, "Nonexistent ID diagnostic not created for MERGE"
+    first = next(diagnostic_dir.glob("*_curator_nonexistent_id.txt"), None)
+    assert first is not None, "Nonexistent ID diagnostic not created for MERGE"
 
-    content = files[0].read_text()
+    content = first.read_text()
     assert "oth-999" in content
     assert "MERGE" in content
 
@@ -1527,10 +1706,10 @@ def test_instrumentation_nonexistent_id_delete(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_nonexistent_id.txt"))
-    assert len(files) >= 1, "Nonexistent ID diagnostic not created for DELETE"
+    first = next(diagnostic_dir.glob("*_curator_nonexistent_id.txt"), None)
+    assert first is not None, "Nonexistent ID diagnostic not created for DELETE"
 
-    content = files[0].read_text()
+    content = first.read_text()
     assert "pat-999" in content
     assert "DELETE" in content
 
@@ -1546,8 +1725,9 @@ def test_instrumentation_nonexistent_id_not_created_when_disabled(project_dir):
 
     diag_dir = project_dir / ".claude" / "diagnostic"
     if diag_dir.exists():
-        files = list(diag_dir.glob("*_curator_nonexistent_id.txt"))
-        assert len(files) == 0, "Nonexistent ID diagnostic created when disabled"
+        assert not any(diag_dir.glob("*_curator_nonexistent_id.txt")), (
+            "Nonexistent ID diagnostic created when disabled"
+        )
 
 
 # ===========================================================================
@@ -1574,10 +1754,10 @@ def test_instrumentation_delete_audit_created(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_delete_audit.txt"))
-    assert len(files) >= 1, "Delete audit diagnostic not created"
+    first = next(diagnostic_dir.glob("*_curator_delete_audit.txt"), None)
+    assert first is not None, "Delete audit diagnostic not created"
 
-    content = files[0].read_text()
+    content = first.read_text()
     assert "oth-001" in content
     assert "bad advice" in content
     assert "contradicts standards" in content
@@ -1602,8 +1782,9 @@ def test_instrumentation_delete_audit_not_created_when_disabled(project_dir):
 
     diag_dir = project_dir / ".claude" / "diagnostic"
     if diag_dir.exists():
-        files = list(diag_dir.glob("*_curator_delete_audit.txt"))
-        assert len(files) == 0, "Delete audit diagnostic created when disabled"
+        assert not any(diag_dir.glob("*_curator_delete_audit.txt")), (
+            "Delete audit diagnostic created when disabled"
+        )
 
 
 # @tests-instrumentation LOG-CUR-003
@@ -1617,8 +1798,9 @@ def test_instrumentation_delete_audit_not_created_when_skipped(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_delete_audit.txt"))
-    assert len(files) == 0, "Delete audit created for skipped DELETE"
+    assert not any(diagnostic_dir.glob("*_curator_delete_audit.txt")), (
+        "Delete audit created for skipped DELETE"
+    )
 
 
 # @tests-instrumentation LOG-CUR-003
@@ -1641,10 +1823,10 @@ def test_instrumentation_delete_audit_text_truncated(
     )
     update_playbook_data(playbook, extraction)
 
-    files = list(diagnostic_dir.glob("*_curator_delete_audit.txt"))
-    assert len(files) >= 1
+    first = next(diagnostic_dir.glob("*_curator_delete_audit.txt"), None)
+    assert first is not None
 
-    content = files[0].read_text()
+    content = first.read_text()
     # Full 200-char text should NOT appear
     assert long_text not in content
     # First 80 chars should appear
@@ -1699,16 +1881,15 @@ def test_full_curator_lifecycle(project_dir):
 
     # MERGE: pat-001 and pat-002 removed, new merged entry created
     assert "use types and dataclasses" in pat_texts
-    pat_names = [kp["name"] for kp in pat]
-    assert "pat-001" not in pat_names
-    assert "pat-002" not in pat_names
+    pat_by_name = _by_name(pat)
+    assert "pat-001" not in pat_by_name
+    assert "pat-002" not in pat_by_name
 
     # DELETE: mis-001 removed
     assert len(result["sections"]["MISTAKES TO AVOID"]) == 0
 
     # Evaluations: oth-001 helpful incremented
-    oth_001 = next(kp for kp in result["sections"]["OTHERS"] if kp["name"] == "oth-001")
-    assert oth_001["helpful"] == 2
+    assert _by_name(result["sections"]["OTHERS"])["oth-001"]["helpful"] == 2
 
     # new_key_points ignored (operations present)
     all_texts = _collect_all_texts(result)
@@ -13,12 +13,11 @@ structures, or design.md.  They verify only the documented public
 behaviour from the spec.
 """
 
+import collections
 import json
 import os
 import platform
-import stat
 import subprocess
-import textwrap
 
 import shutil
 
@@ -36,21 +35,26 @@ SRC_DIR = os.path.join(PROJECT_ROOT, "src")
 
 # Resolve the directory containing the `node` binary so we can construct
 # a PATH that includes node but excludes `uv` for "uv not found" tests.
-_NODE_BIN = shutil.which("node")
+# HOOKS_TEST_NODE (absolute path to node) skips the PATH search, e.g. in CI
+# images where node lives at a fixed location.
+_NODE_BIN = os.environ.get("HOOKS_TEST_NODE") or shutil.which("node")
 _NODE_DIR = os.path.dirname(_NODE_BIN) if _NODE_BIN else "/usr/local/bin"
+# node's directory + standard system dirs: `which uv` fails, `node` still runs.
+_PATH_WITHOUT_UV = os.pathsep.join([_NODE_DIR, "/usr/bin", "/bin"])
 
-# The three event types and their expected script names
-EVENT_SCRIPT_MAP = {
-    "UserPromptSubmit": "user_prompt_inject.py",
-    "SessionEnd": "session_end.py",
-    "PreCompact": "precompact.py",
+# Inherited environment minus the keys contract_env always overrides
+_BASE_ENV = {
+    k: v for k, v in os.environ.items() if k not in ("HOME", "USERPROFILE", "PATH")
 }
 
-EVENT_TIMEOUT_MAP = {
-    "UserPromptSubmit": 10,
-    "SessionEnd": 120,
-    "PreCompact": 120,
-}
+# The three event types with their expected script names and timeouts
+Event = collections.namedtuple("Event", "name script timeout")
+
+EVENTS = (
+    Event("UserPromptSubmit", "user_prompt_inject.py", 10),
+    Event("SessionEnd", "session_end.py", 120),
+    Event("PreCompact", "precompact.py", 120),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -58,8 +62,36 @@ EVENT_TIMEOUT_MAP = {
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def contract_env(tmp_path):
+def _fake_uv_script(sync_exit):
+    """POSIX sh fake `uv` that exits `sync_exit` on `uv sync`, 0 otherwise.
+
+    sh rather than bash: install.js execs it on every run, and where
+    /bin/sh is dash it starts noticeably faster than bash.
+    """
+    return (
+        "#!/bin/sh\n"
+        'if [ "$1" = "sync" ]; then\n'
+        f"    exit {sync_exit}\n"
+        "fi\n"
+        'echo "fake uv called with: $*" >&2\n'
+        "exit 0\n"
+    ).encode()
+
+
+FAKE_UV_OK = _fake_uv_script(0)
+FAKE_UV_SYNC_FAIL = _fake_uv_script(2)
+
+
+def write_fake_uv(path, script=FAKE_UV_OK):
+    """Write a prebuilt fake `uv` script, created executable (0o700) in one open."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o700)
+    try:
+        os.write(fd, script)
+    finally:
+        os.close(fd)
+
+
+def _make_contract_env(tmp_path):
     """
     Set up a complete contract test environment:
     - Fake HOME directory with .claude/ structure
@@ -67,6 +99,9 @@ def contract_env(tmp_path):
     - Environment dict ready for subprocess.run
     - Helper to read the resulting settings.json
 
+    install.js is run with the node found on PATH at import, or with
+    $HOOKS_TEST_NODE when that is set.
+
     Returns a namespace-like dict with helpers.
     """
     home_dir = str(tmp_path / "home")
@@ -80,24 +115,15 @@ def contract_env(tmp_path):
 
     # Create fake uv binary
     uv_script = os.path.join(bin_dir, "uv")
-    with open(uv_script, "w") as f:
-        f.write(textwrap.dedent("""\
-            #!/bin/bash
-            if [[ "$1" == "sync" ]]; then
-                exit 0
-            fi
-            echo "fake uv called with: $@" >&2
-            exit 0
-        """))
-    os.chmod(uv_script, stat.S_IRWXU)
+    write_fake_uv(uv_script)
 
     # Build environment
-    env = os.environ.copy()
+    env = dict(_BASE_ENV)
     env["HOME"] = home_dir
     if platform.system() == "Windows":
         env["USERPROFILE"] = home_dir
     # Prepend our bin dir so `which uv` finds our fake
-    env["PATH"] = bin_dir + os.pathsep + env.get("PATH", "")
+    env["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
 
     class Env:
         pass
@@ -112,14 +138,19 @@ def contract_env(tmp_path):
     e.env = env
     e.tmp_path = tmp_path
 
-    def run_install(extra_env=None, check=False):
-        """Run node install.js and return the subprocess result."""
+    def run_install(extra_env=None, check=False, *, capture_stdout=False):
+        """Run node install.js and return the subprocess result.
+
+        Only stderr is captured by default (every assertion reads stderr or
+        the exit code); pass capture_stdout=True to get `.stdout` as well.
+        """
         run_env = dict(e.env)
         if extra_env:
             run_env.update(extra_env)
         return subprocess.run(
-            ["node", INSTALL_JS],
-            capture_output=True,
+            [_NODE_BIN or "node", INSTALL_JS],
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=run_env,
             timeout=30,
@@ -127,15 +158,21 @@ def contract_env(tmp_path):
 
     def read_settings():
         """Read and parse the resulting settings.json."""
-        with open(settings_path) as f:
-            return json.load(f)
+        return json.loads(read_settings_bytes())
+
+    def read_settings_bytes():
+        """Raw settings.json bytes, for byte-exact "not modified" checks."""
+        with open(settings_path, "rb") as f:
+            return f.read()
 
     def write_settings(content):
         """Write pre-existing settings.json."""
         os.makedirs(os.path.dirname(settings_path), exist_ok=True)
         if isinstance(content, dict):
             content = json.dumps(content, indent=2)
-        with open(settings_path, "w") as f:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        with open(settings_path, "wb") as f:
             f.write(content)
 
     def extract_commands(settings, event_name):
@@ -146,18 +183,46 @@ def contract_env(tmp_path):
                 commands.append(hook.get("command", ""))
         return commands
 
-    def path_without_uv():
-        """Return a PATH string that includes node but does NOT include uv."""
-        # We build a minimal PATH: node's directory + standard system dirs.
-        # This ensures `which uv` will fail but `node` is still available.
-        dirs = [_NODE_DIR, "/usr/bin", "/bin"]
-        return os.pathsep.join(dirs)
+    def index_commands(settings):
+        """Map every event type to its command strings in one pass."""
+        return {
+            event_name: [
+                hook.get("command", "")
+                for group in groups
+                for hook in group.get("hooks", [])
+            ]
+            for event_name, groups in settings.get("hooks", {}).items()
+        }
 
     e.run_install = run_install
     e.read_settings = read_settings
+    e.read_settings_bytes = read_settings_bytes
     e.write_settings = write_settings
     e.extract_commands = extract_commands
-    e.path_without_uv = path_without_uv
+    e.index_commands = index_commands
+    # PATH that includes node but does NOT include uv
+    e.path_without_uv = _PATH_WITHOUT_UV
+    return e
+
+
+@pytest.fixture
+def contract_env(tmp_path):
+    """Fresh per-test environment, for tests that seed or mutate state."""
+    return _make_contract_env(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def fresh_install(tmp_path_factory):
+    """One clean `node install.js` run shared by the read-only tests.
+
+    Same environment as contract_env, with the install already run once:
+    `.result` is the CompletedProcess and `.settings` the parsed
+    settings.json (None if the install failed). Consumers must not mutate
+    either, nor the files under `.home_dir`.
+    """
+    e = _make_contract_env(tmp_path_factory.mktemp("fresh_install"))
+    e.result = e.run_install()
+    e.settings = e.read_settings() if e.result.returncode == 0 else None
     return e
 
 
@@ -179,18 +244,19 @@ def make_hook_group(command, hook_type="command", timeout=10):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_commands_use_uv_run(contract_env):
+def test_contract_commands_use_uv_run(fresh_install):
     # @tests-contract REQ-HOOKS-001
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    settings = contract_env.read_settings()
-    for event_name in EVENT_SCRIPT_MAP:
-        commands = contract_env.extract_commands(settings, event_name)
-        assert len(commands) >= 1, f"No commands for {event_name}"
+    settings = fresh_install.settings
+    commands_by_event = fresh_install.index_commands(settings)
+    for ev in EVENTS:
+        commands = commands_by_event.get(ev.name, [])
+        assert len(commands) >= 1, f"No commands for {ev.name}"
         for cmd in commands:
             assert "uv run --project" in cmd, (
-                f"Command for {event_name} does not use uv run: {cmd}"
+                f"Command for {ev.name} does not use uv run: {cmd}"
             )
 
 
@@ -199,18 +265,21 @@ def test_contract_commands_use_uv_run(contract_env):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_command_format(contract_env):
+def test_contract_command_format(fresh_install):
     # @tests-contract REQ-HOOKS-003
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    settings = contract_env.read_settings()
-    uv_path = contract_env.uv_script  # absolute path to our fake uv
+    settings = fresh_install.settings
+    uv_path = fresh_install.uv_script  # absolute path to our fake uv
+
+    hooks_dir = os.path.join(fresh_install.home_dir, ".claude", "hooks")
 
-    for event_name, script_name in EVENT_SCRIPT_MAP.items():
-        commands = contract_env.extract_commands(settings, event_name)
+    commands_by_event = fresh_install.index_commands(settings)
+    for ev in EVENTS:
+        commands = commands_by_event.get(ev.name, [])
         assert len(commands) == 1, (
-            f"Expected 1 command for {event_name}, got {len(commands)}"
+            f"Expected 1 command for {ev.name}, got {len(commands)}"
         )
         cmd = commands[0]
         # Verify format: <abs_uv> run --project "<abs_dir>" python "<abs_script>"
@@ -218,10 +287,8 @@ def test_contract_command_format(contract_env):
             f"Command does not start with absolute uv path: {cmd}"
         )
         assert f'python "' in cmd
-        # Script path should point to ~/.claude/hooks/<script_name>
-        expected_script = os.path.join(
-            contract_env.home_dir, ".claude", "hooks", script_name
-        )
+        # Script path should point to ~/.claude/hooks/<script>
+        expected_script = os.path.join(hooks_dir, ev.script)
         assert f'python "{expected_script}"' in cmd, (
             f"Script path mismatch in: {cmd}"
         )
@@ -256,12 +323,13 @@ def test_contract_stale_entries_removed(contract_env):
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
     settings = contract_env.read_settings()
-    for event_name in EVENT_SCRIPT_MAP:
-        commands = contract_env.extract_commands(settings, event_name)
+    commands_by_event = contract_env.index_commands(settings)
+    for ev in EVENTS:
+        commands = commands_by_event.get(ev.name, [])
         for cmd in commands:
             # No stale python3 commands should remain
             assert 'python3 "' not in cmd, (
-                f"Stale python3 entry not removed in {event_name}: {cmd}"
+                f"Stale python3 entry not removed in {ev.name}: {cmd}"
             )
             assert "uv run" in cmd
 
@@ -302,21 +370,37 @@ def test_contract_non_project_hooks_preserved(contract_env):
 
 
 def test_contract_uv_not_found_error(contract_env):
-    # @tests-contract REQ-HOOKS-007
-    # If there's a pre-existing settings.json, verify it's not modified
-    contract_env.write_settings({"existing": "value"})
+    # @tests-contract REQ-HOOKS-007 (TC-ERR-001, TC-ERR-002)
+    # @tests-invariant INV-HOOKS-004
+    # One install run covers the exit code, the exact message and the
+    # untouched settings.json
+    original_content = {"hooks": {"SessionEnd": [make_hook_group("keep me")]}}
+    contract_env.write_settings(original_content)
+    before = contract_env.read_settings_bytes()
 
-    no_uv_path = contract_env.path_without_uv()
+    no_uv_path = contract_env.path_without_uv
     result = contract_env.run_install(extra_env={"PATH": no_uv_path})
     assert result.returncode != 0, "Should exit non-zero when uv not found"
-    assert "not installed" in result.stderr or "not found" in result.stderr, (
-        f"Expected error message about uv not found, got: {result.stderr}"
+
+    # Q8: Assert the EXACT full error message from REQ-HOOKS-007 (both lines)
+    expected_line1 = (
+        "Error: 'uv' is not installed or not found on PATH. "
+        "Install it with: curl -LsSf https://astral.sh/uv/install.sh | sh"
+    )
+    expected_line2 = (
+        "See https://docs.astral.sh/uv/getting-started/installation/ for other methods."
+    )
+    assert expected_line1 in result.stderr, (
+        f"Missing first line of REQ-HOOKS-007 error message.\n"
+        f"Expected: {expected_line1}\nGot stderr: {result.stderr}"
+    )
+    assert expected_line2 in result.stderr, (
+        f"Missing second line of REQ-HOOKS-007 error message.\n"
+        f"Expected: {expected_line2}\nGot stderr: {result.stderr}"
     )
 
     # Settings should not be modified
-    with open(contract_env.settings_path) as f:
-        content = json.load(f)
-    assert content == {"existing": "value"}, (
+    assert contract_env.read_settings_bytes() == before, (
         "Settings were modified despite uv not found error"
     )
 
@@ -326,14 +410,15 @@ def test_contract_uv_not_found_error(contract_env):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_absolute_uv_path(contract_env):
+def test_contract_absolute_uv_path(fresh_install):
     # @tests-contract REQ-HOOKS-008
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    settings = contract_env.read_settings()
-    for event_name in EVENT_SCRIPT_MAP:
-        commands = contract_env.extract_commands(settings, event_name)
+    settings = fresh_install.settings
+    commands_by_event = fresh_install.index_commands(settings)
+    for ev in EVENTS:
+        commands = commands_by_event.get(ev.name, [])
         for cmd in commands:
             # Command should start with an absolute path, not bare "uv"
             assert cmd.startswith("/"), (
@@ -350,32 +435,23 @@ def test_contract_absolute_uv_path(contract_env):
 
 
 def test_contract_uv_sync_failure_aborts(contract_env):
-    # @tests-contract REQ-HOOKS-009
+    # @tests-contract REQ-HOOKS-009 (TC-ERR-003, TC-ERR-004)
+    # @tests-invariant INV-HOOKS-004
     # Replace fake uv with one that fails on sync
-    with open(contract_env.uv_script, "w") as f:
-        f.write(textwrap.dedent("""\
-            #!/bin/bash
-            if [[ "$1" == "sync" ]]; then
-                exit 2
-            fi
-            echo "fake uv called with: $@" >&2
-            exit 0
-        """))
-    os.chmod(contract_env.uv_script, stat.S_IRWXU)
-
-    # Write pre-existing settings
-    contract_env.write_settings({"existing": "value"})
+    write_fake_uv(contract_env.uv_script, FAKE_UV_SYNC_FAIL)
+
+    original_content = {"hooks": {"SessionEnd": [make_hook_group("keep me")]}}
+    contract_env.write_settings(original_content)
+    before = contract_env.read_settings_bytes()
 
     result = contract_env.run_install()
     assert result.returncode != 0, "Should exit non-zero when uv sync fails"
-    assert "uv sync failed" in result.stderr.lower() or "uv sync" in result.stderr.lower(), (
-        f"Expected error about uv sync failure, got: {result.stderr}"
+    assert "uv sync" in result.stderr.lower(), (
+        f"Error message should mention uv sync: {result.stderr}"
     )
 
     # Settings should not be modified
-    with open(contract_env.settings_path) as f:
-        content = json.load(f)
-    assert content == {"existing": "value"}, (
+    assert contract_env.read_settings_bytes() == before, (
         "Settings were modified despite uv sync failure"
     )
 
@@ -385,12 +461,12 @@ def test_contract_uv_sync_failure_aborts(contract_env):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_output_is_valid_json(contract_env):
+def test_contract_output_is_valid_json(fresh_install):
     # @tests-contract INV-HOOKS-007
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    with open(contract_env.settings_path) as f:
+    with open(fresh_install.settings_path) as f:
         raw = f.read()
 
     # Must be parseable JSON
@@ -404,34 +480,33 @@ def test_contract_output_is_valid_json(contract_env):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_full_install_fresh(contract_env):
+def test_contract_full_install_fresh(fresh_install):
     # @tests-contract REQ-HOOKS-001, REQ-HOOKS-003, REQ-HOOKS-008
     # Fresh install with no prior settings.json
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    settings = contract_env.read_settings()
+    settings = fresh_install.settings
+
+    # Valid JSON
+    assert isinstance(settings, dict)
 
-    # All three event types should have hooks
-    for event_name, script_name in EVENT_SCRIPT_MAP.items():
-        commands = contract_env.extract_commands(settings, event_name)
+    # All three event types should have one hook with the right command and timeout
+    commands_by_event = fresh_install.index_commands(settings)
+    for ev in EVENTS:
+        commands = commands_by_event.get(ev.name, [])
         assert len(commands) == 1, (
-            f"Expected 1 command for {event_name}, got {len(commands)}: {commands}"
+            f"Expected 1 command for {ev.name}, got {len(commands)}: {commands}"
         )
         cmd = commands[0]
         assert "uv run --project" in cmd
-        assert script_name in cmd
+        assert ev.script in cmd
         # Command starts with absolute path
         assert cmd.startswith("/")
 
-    # Valid JSON
-    assert isinstance(settings, dict)
-
-    # Timeouts correct
-    for event_name, expected_timeout in EVENT_TIMEOUT_MAP.items():
-        for group in settings["hooks"][event_name]:
+        for group in settings["hooks"][ev.name]:
             for hook in group["hooks"]:
-                assert hook["timeout"] == expected_timeout
+                assert hook["timeout"] == ev.timeout
 
 
 def test_contract_full_install_with_stale_entries(contract_env):
@@ -463,8 +538,8 @@ def test_contract_full_install_with_stale_entries(contract_env):
     settings = contract_env.read_settings()
 
     # Stale entries removed
-    for event_name in EVENT_SCRIPT_MAP:
-        for cmd in contract_env.extract_commands(settings, event_name):
+    for ev in EVENTS:
+        for cmd in contract_env.extract_commands(settings, ev.name):
             assert 'python3 "' not in cmd or "document_scanner" in cmd
 
     # Non-project hook preserved
@@ -480,14 +555,15 @@ def test_contract_full_install_idempotent(contract_env):
     # Run install twice, verify identical result
     result1 = contract_env.run_install()
     assert result1.returncode == 0, f"First install failed: {result1.stderr}"
-    settings1 = contract_env.read_settings()
+    first = contract_env.read_settings_bytes()
+    assert "hooks" in contract_env.read_settings()
 
     result2 = contract_env.run_install()
     assert result2.returncode == 0, f"Second install failed: {result2.stderr}"
-    settings2 = contract_env.read_settings()
 
-    assert settings1["hooks"] == settings2["hooks"], (
-        "Idempotency violated: second install produced different hooks"
+    # Byte-identical output: stronger than comparing the parsed "hooks" dicts
+    assert contract_env.read_settings_bytes() == first, (
+        "Idempotency violated: second install rewrote settings.json differently"
     )
 
 
@@ -496,101 +572,16 @@ def test_contract_full_install_idempotent(contract_env):
 # ---------------------------------------------------------------------------
 
 
-def test_contract_err_uv_not_found_no_file_modification(contract_env):
-    # @tests-contract REQ-HOOKS-007 (TC-ERR-002)
-    # @tests-invariant INV-HOOKS-004
-    # Verify settings.json is NOT modified when uv is not found
-    original_content = {"hooks": {"SessionEnd": [make_hook_group("keep me")]}}
-    contract_env.write_settings(original_content)
-
-    no_uv_path = contract_env.path_without_uv()
-    result = contract_env.run_install(extra_env={"PATH": no_uv_path})
-    assert result.returncode != 0
-
-    with open(contract_env.settings_path) as f:
-        after = json.load(f)
-    assert after == original_content, "File was modified despite uv-not-found error"
-
-
-def test_contract_err_uv_sync_failure_no_file_modification(contract_env):
-    # @tests-contract REQ-HOOKS-009 (TC-ERR-004)
-    # @tests-invariant INV-HOOKS-004
-    # Replace uv with a script that fails on sync
-    with open(contract_env.uv_script, "w") as f:
-        f.write(textwrap.dedent("""\
-            #!/bin/bash
-            if [[ "$1" == "sync" ]]; then
-                exit 2
-            fi
-            exit 0
-        """))
-    os.chmod(contract_env.uv_script, stat.S_IRWXU)
-
-    original_content = {"hooks": {"SessionEnd": [make_hook_group("keep me")]}}
-    contract_env.write_settings(original_content)
-
-    result = contract_env.run_install()
-    assert result.returncode != 0
-
-    with open(contract_env.settings_path) as f:
-        after = json.load(f)
-    assert after == original_content, "File was modified despite uv sync failure"
-
-
-def test_contract_err_uv_sync_error_message(contract_env):
-    # @tests-contract REQ-HOOKS-009 (TC-ERR-003)
-    with open(contract_env.uv_script, "w") as f:
-        f.write(textwrap.dedent("""\
-            #!/bin/bash
-            if [[ "$1" == "sync" ]]; then
-                exit 2
-            fi
-            exit 0
-        """))
-    os.chmod(contract_env.uv_script, stat.S_IRWXU)
-
-    result = contract_env.run_install()
-    assert result.returncode != 0
-    stderr_lower = result.stderr.lower()
-    # Should mention uv sync failure
-    assert "uv sync" in stderr_lower, (
-        f"Error message should mention uv sync: {result.stderr}"
-    )
-
-
-def test_contract_err_uv_not_found_error_message(contract_env):
-    # @tests-contract REQ-HOOKS-007 (TC-ERR-001)
-    no_uv_path = contract_env.path_without_uv()
-    result = contract_env.run_install(extra_env={"PATH": no_uv_path})
-    assert result.returncode != 0
-
-    # Q8: Assert the EXACT full error message from REQ-HOOKS-007 (both lines)
-    expected_line1 = (
-        "Error: 'uv' is not installed or not found on PATH. "
-        "Install it with: curl -LsSf https://astral.sh/uv/install.sh | sh"
-    )
-    expected_line2 = (
-        "See https://docs.astral.sh/uv/getting-started/installation/ for other methods."
-    )
-    assert expected_line1 in result.stderr, (
-        f"Missing first line of REQ-HOOKS-007 error message.\n"
-        f"Expected: {expected_line1}\nGot stderr: {result.stderr}"
-    )
-    assert expected_line2 in result.stderr, (
-        f"Missing second line of REQ-HOOKS-007 error message.\n"
-        f"Expected: {expected_line2}\nGot stderr: {result.stderr}"
-    )
-
-
-def test_contract_err_hooks_dir_created(contract_env):
+def test_contract_err_hooks_dir_created(fresh_install):
     # @tests-contract REQ-HOOKS-003 (TC-ERR-005 variant: verify hooks are copied)
     # On successful install, hook scripts should be copied to ~/.claude/hooks/
-    result = contract_env.run_install()
+    result = fresh_install.result
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
-    # Verify hook script files exist in the destination
-    for script_name in EVENT_SCRIPT_MAP.values():
-        script_path = os.path.join(contract_env.hooks_dir, script_name)
-        assert os.path.exists(script_path), (
-            f"Hook script not copied: {script_path}"
-        )
+    # Verify hook script files exist in the destination (one directory read)
+    with os.scandir(fresh_install.hooks_dir) as it:
+        present = {entry.name for entry in it}
+    missing = {ev.script for ev in EVENTS} - present
+    assert not missing, (
+        f"Hook scripts not copied to {fresh_install.hooks_dir}: {sorted(missing)}"
+    )
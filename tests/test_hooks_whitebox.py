@@ -6,18 +6,23 @@ White-box tests for the hooks module (install.js mergeSettings function).
 Covers all REQ-HOOKS-*, SCN-HOOKS-*, INV-HOOKS-* from spec.md,
 plus adversarial test categories TC-INVAL-*, TC-STALE-*, TC-BOUND-*.
 
-Test approach: call mergeSettings() via a small Node.js helper that
-requires install.js with HOME overridden so that all path derivation
-points to a temp directory. The helper writes JSON output to stdout
-which the Python test parses and asserts on.
+Test approach: call mergeSettings() via a session-wide Node.js worker
+(tests/_hooks_helper.js) that runs install.js with HOME overridden so that
+all path derivation points to a temp directory. Requests go to the worker's
+stdin as JSON lines; the worker answers each with one JSON line on a
+dedicated reply pipe inherited via pass_fds (its stdout is discarded), which
+the Python test parses and asserts on. The pipe and select() make this
+module POSIX-only.
 """
 
 import json
 import os
-import platform
+import pathlib
+import re
+import select
 import shutil
 import subprocess
-import textwrap
+import uuid
 
 import pytest
 
@@ -25,11 +30,24 @@ import pytest
 # Constants
 # ---------------------------------------------------------------------------
 
-PROJECT_ROOT = str(
-    __import__("pathlib").Path(__file__).resolve().parent.parent
-)
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
 INSTALL_JS = os.path.join(PROJECT_ROOT, "install.js")
 SRC_SETTINGS = os.path.join(PROJECT_ROOT, "src", "settings.json")
+# Static worker script that serves call_merge_settings() requests
+HELPER_JS = os.path.join(PROJECT_ROOT, "tests", "_hooks_helper.js")
+
+# HOOKS_TEST_NODE (absolute path to node) skips the PATH search, as in the
+# contract tests. node's directory + standard system dirs: `which uv` fails,
+# `node` still runs.
+_NODE_BIN = os.environ.get("HOOKS_TEST_NODE") or shutil.which("node")
+_NODE_DIR = os.path.dirname(_NODE_BIN) if _NODE_BIN else "/usr/local/bin"
+_PATH_WITHOUT_UV = os.pathsep.join([_NODE_DIR, "/usr/bin", "/bin"])
+
+# Inherited environment minus the keys the install subprocess tests override
+_BASE_ENV = {
+    k: v for k, v in os.environ.items() if k not in ("HOME", "USERPROFILE", "PATH")
+}
+_INHERITED_PATH = os.environ.get("PATH", "")
 
 # The three project scripts as referenced by install.js
 PROJECT_SCRIPTS = ["user_prompt_inject.py", "session_end.py", "precompact.py"]
@@ -48,115 +66,159 @@ EVENT_TIMEOUT_MAP = {
     "PreCompact": 120,
 }
 
+# Quoted path arguments inside a generated hook command
+_PROJECT_ARG_RE = re.compile(r'--project "([^"]+)"')
+_SCRIPT_ARG_RE = re.compile(r'python "([^"]+)"')
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+def _json_dumps_line(obj):
+    """Serialize a worker request as one newline-terminated UTF-8 line."""
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+class _NodeWorker:
+    """A long-lived `node` process that runs install.js in-process.
+
+    It answers mergeSettings() calls and full install() runs. Starting node
+    and loading install.js once per session instead of once per test removes
+    the dominant cost of this module. Replies arrive on a dedicated pipe so
+    that output from `uv sync`, which inherits the worker's stdio, cannot
+    interleave with them.
+    """
+
+    def __init__(self):
+        reply_r, reply_w = os.pipe()
+        try:
+            self._proc = subprocess.Popen(
+                [_NODE_BIN, HELPER_JS, INSTALL_JS, str(reply_w)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                pass_fds=(reply_w,),
+            )
+        finally:
+            os.close(reply_w)
+        self._replies = os.fdopen(reply_r, "rb")
+
+    def request(self, payload, timeout=None):
+        """Send one request and return the parsed JSON reply."""
+        self._proc.stdin.write(_json_dumps_line(payload))
+        self._proc.stdin.flush()
+        if timeout is not None:
+            ready, _, _ = select.select([self._replies], [], [], timeout)
+            if not ready:
+                raise subprocess.TimeoutExpired([_NODE_BIN, HELPER_JS], timeout)
+        line = self._replies.readline()
+        if not line:
+            raise RuntimeError(
+                f"Node worker exited (code {self._proc.poll()})"
+            )
+        return json.loads(line)
+
+    def close(self):
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._replies.close()
+
+
+_node_worker = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def src_settings_template():
+    """
+    Load the src/settings.json template once per session.
+
+    A missing template fails the module up front instead of surfacing as a
+    mergeSettings() failure in every test.
+    """
+    try:
+        with open(SRC_SETTINGS, "rb") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        pytest.fail(f"Source settings template not found: {SRC_SETTINGS}")
+    assert "hooks" in data, f"No hooks in source settings template: {SRC_SETTINGS}"
+    return data
+
+
+@pytest.fixture(scope="session", autouse=True)
+def node_worker(src_settings_template):
+    """One node worker for every call_merge_settings() in the session."""
+    global _node_worker
+    if _NODE_BIN is None:
+        pytest.skip("node not found on PATH (set HOOKS_TEST_NODE to its absolute path)")
+    _node_worker = _NodeWorker()
+    yield _node_worker
+    _node_worker.close()
+    _node_worker = None
+
+
+# Fake `uv`: `uv sync` exits with $FAKE_UV_SYNC_EXIT (default 0), anything
+# else succeeds
+_FAKE_UV_SCRIPT = (
+    "#!/bin/sh\n"
+    'if [ "$1" = "sync" ]; then exit "${FAKE_UV_SYNC_EXIT:-0}"; fi\n'
+    "exit 0\n"
+)
+
+
+@pytest.fixture(scope="session")
+def fake_uv_bin(tmp_path_factory):
+    """A bin/ directory holding the fake uv, written once per session."""
+    bin_dir = tmp_path_factory.mktemp("fake_uv_bin")
+    fake_uv = bin_dir / "uv"
+    fake_uv.write_text(_FAKE_UV_SCRIPT)
+    fake_uv.chmod(0o755)
+    return str(bin_dir)
+
+
+@pytest.fixture(scope="session")
+def session_home(tmp_path_factory):
+    """Shared temp root for merges that seed no destination settings."""
+    return tmp_path_factory.mktemp("hooks_session")
+
+
+@pytest.fixture
+def scratch_path(session_home):
+    """
+    A unique, not-yet-created directory under session_home.
+
+    Stands in for tmp_path in tests that pass no dest_settings_content: the
+    worker only derives HOME from it, so nothing is created per test.
+    """
+    return session_home / uuid.uuid4().hex
+
+
 def call_merge_settings(
     tmp_path, src_settings_path, abs_uv_path, project_dir,
     dest_settings_content=None,
 ):
     """
-    Call mergeSettings() in a Node.js subprocess with HOME set to tmp_path
-    so that the module-level settingsPath resolves to tmp_path/.claude/settings.json.
+    Call mergeSettings() in the session's node worker with HOME set to
+    tmp_path so that the module-level settingsPath resolves to
+    tmp_path/.claude/settings.json.
 
-    If dest_settings_content is provided, write it to the destination path
-    before calling mergeSettings.
+    If dest_settings_content is provided, the worker writes it to the
+    destination path before calling mergeSettings.
 
-    Returns the merged settings dict parsed from JSON stdout.
+    Returns the merged settings dict parsed from the worker's JSON reply.
     """
-    home_dir = str(tmp_path / "home")
-    claude_dir = os.path.join(home_dir, ".claude")
-    hooks_dir = os.path.join(claude_dir, "hooks")
-    dest_settings_path = os.path.join(claude_dir, "settings.json")
-
-    os.makedirs(hooks_dir, exist_ok=True)
-
-    if dest_settings_content is not None:
-        with open(dest_settings_path, "w") as f:
-            f.write(dest_settings_content)
-
-    # Node.js helper: require install.js with HOME overridden, call mergeSettings,
-    # output the result as JSON.
-    # We must set HOME BEFORE require() so that os.homedir() returns our temp dir.
-    helper_js = textwrap.dedent(f"""\
-        // Override HOME before requiring install.js so module-level paths use temp dir
-        process.env.HOME = {json.dumps(home_dir)};
-        // Also set USERPROFILE for Windows compatibility
-        process.env.USERPROFILE = {json.dumps(home_dir)};
-
-        // Clear the require cache to pick up new HOME
-        delete require.cache[require.resolve({json.dumps(INSTALL_JS)})];
-
-        // Monkey-patch process.exit to prevent it from terminating our helper
-        const originalExit = process.exit;
-        let exitCalled = false;
-        let exitCode = null;
-        process.exit = function(code) {{
-            exitCalled = true;
-            exitCode = code;
-            // Don't actually exit
-        }};
-
-        // Suppress console.log from install() running at require time
-        const originalLog = console.log;
-        const originalError = console.error;
-        const originalWrite = process.stderr.write;
-        console.log = function() {{}};
-        console.error = function() {{}};
-        process.stderr.write = function() {{ return true; }};
-
-        try {{
-            const mod = require({json.dumps(INSTALL_JS)});
-            // Restore
-            console.log = originalLog;
-            console.error = originalError;
-            process.stderr.write = originalWrite;
-            process.exit = originalExit;
-
-            const result = mod.mergeSettings(
-                {json.dumps(src_settings_path)},
-                {json.dumps(abs_uv_path)},
-                {json.dumps(project_dir)}
-            );
-            process.stdout.write(JSON.stringify(result));
-        }} catch (e) {{
-            console.log = originalLog;
-            console.error = originalError;
-            process.stderr.write = originalWrite;
-            process.exit = originalExit;
-
-            process.stdout.write(JSON.stringify({{__error__: e.message}}));
-        }}
-    """)
-
-    helper_path = str(tmp_path / "helper.js")
-    with open(helper_path, "w") as f:
-        f.write(helper_js)
-
-    env = os.environ.copy()
-    env["HOME"] = home_dir
-    if platform.system() == "Windows":
-        env["USERPROFILE"] = home_dir
-
-    result = subprocess.run(
-        ["node", helper_path],
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=30,
-    )
-
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Node helper failed (exit {result.returncode}):\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
-        )
-
-    parsed = json.loads(result.stdout)
+    parsed = _node_worker.request({
+        "op": "merge",
+        "home": str(tmp_path / "home"),
+        "src": src_settings_path,
+        "uv": abs_uv_path,
+        "project": project_dir,
+        "destContent": dest_settings_content,
+    })
     if isinstance(parsed, dict) and "__error__" in parsed:
         raise RuntimeError(f"mergeSettings threw: {parsed['__error__']}")
     return parsed
@@ -188,6 +250,11 @@ def make_settings_with_hooks(hook_entries):
     return json.dumps({"hooks": hooks}, indent=2)
 
 
+def hook_script_path(home, script_name):
+    """Installed path of a hook script as embedded in generated commands."""
+    return f"{home}/.claude/hooks/{script_name}"
+
+
 def extract_commands(merged, event_name):
     """Extract all command strings from a merged settings event type."""
     commands = []
@@ -197,6 +264,18 @@ def extract_commands(merged, event_name):
     return commands
 
 
+def index_commands(merged):
+    """Map every event type to its command strings in one pass."""
+    return {
+        event_name: [
+            hook.get("command", "")
+            for group in groups
+            for hook in group.get("hooks", [])
+        ]
+        for event_name, groups in merged.get("hooks", {}).items()
+    }
+
+
 def count_project_hooks(merged, event_name, script_name):
     """Count hook entries whose command references a specific project script."""
     substring = f"/.claude/hooks/{script_name}"
@@ -212,16 +291,17 @@ def count_project_hooks(merged, event_name, script_name):
 # ---------------------------------------------------------------------------
 
 
-def test_command_uses_uv_run(tmp_path):
+def test_command_uses_uv_run(scratch_path):
     # @tests REQ-HOOKS-001
     merged = call_merge_settings(
-        tmp_path,
+        scratch_path,
         SRC_SETTINGS,
         "/usr/local/bin/uv",
         "/Users/jane/projects/ace",
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) >= 1, f"No commands for {event_name}"
         for cmd in commands:
             assert "uv run --project" in cmd, (
@@ -229,16 +309,17 @@ def test_command_uses_uv_run(tmp_path):
             )
 
 
-def test_scn_generated_command_uses_uv_not_python3(tmp_path):
+def test_scn_generated_command_uses_uv_not_python3(scratch_path):
     # @tests SCN-HOOKS-001-01
     merged = call_merge_settings(
-        tmp_path,
+        scratch_path,
         SRC_SETTINGS,
         "/Users/jane/.local/bin/uv",
         "/Users/jane/projects/ace",
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         for cmd in commands:
             assert 'python3 "' not in cmd, (
                 f"Command still uses bare python3: {cmd}"
@@ -251,88 +332,37 @@ def test_scn_generated_command_uses_uv_not_python3(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_command_format_standard_paths(tmp_path):
-    # @tests REQ-HOOKS-003
-    uv_path = "/Users/jane/.local/bin/uv"
-    project_dir = "/Users/jane/projects/ace"
-    home = str(tmp_path / "home")
-
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
-    )
-    # Check the session_end command format
-    commands = extract_commands(merged, "SessionEnd")
-    assert len(commands) == 1
-    expected_script = os.path.join(home, ".claude", "hooks", "session_end.py")
-    expected = f'{uv_path} run --project "{project_dir}" python "{expected_script}"'
-    assert commands[0] == expected, f"Got: {commands[0]}\nExpected: {expected}"
-
-
-def test_command_format_spaces_in_paths(tmp_path):
-    # @tests REQ-HOOKS-003
-    uv_path = "/usr/local/bin/uv"
-    project_dir = "/Users/John Doe/projects/ace"
-    home = str(tmp_path / "home")
-
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
-    )
-    commands = extract_commands(merged, "PreCompact")
-    assert len(commands) == 1
-    expected_script = os.path.join(home, ".claude", "hooks", "precompact.py")
-    expected = f'{uv_path} run --project "{project_dir}" python "{expected_script}"'
-    assert commands[0] == expected, f"Got: {commands[0]}\nExpected: {expected}"
-
-
-def test_scn_command_format_no_spaces(tmp_path):
-    # @tests SCN-HOOKS-003-01
-    uv_path = "/Users/jane/.local/bin/uv"
-    project_dir = "/Users/jane/projects/ace"
-    home = str(tmp_path / "home")
-
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
-    )
-    commands = extract_commands(merged, "UserPromptSubmit")
-    assert len(commands) == 1
-    expected_script = os.path.join(home, ".claude", "hooks", "user_prompt_inject.py")
-    expected = f'{uv_path} run --project "{project_dir}" python "{expected_script}"'
-    assert commands[0] == expected
-
-
-def test_scn_command_format_with_spaces(tmp_path):
-    # @tests SCN-HOOKS-003-02
-    uv_path = "/usr/local/bin/uv"
-    project_dir = "/Users/John Doe/projects/ace"
-    home = str(tmp_path / "home")
-
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
-    )
-    commands = extract_commands(merged, "PreCompact")
-    assert len(commands) == 1
-    # Both project dir and script path are double-quoted in the command
-    assert f'--project "{project_dir}"' in commands[0]
-    script_path = os.path.join(home, ".claude", "hooks", "precompact.py")
-    assert f'python "{script_path}"' in commands[0]
+# (uv_path, project_dir) per command-format scenario
+_COMMAND_FORMAT_CASES = {
+    # SCN-HOOKS-003-01: standard paths, no spaces
+    "SCN-HOOKS-003-01": ("/Users/jane/.local/bin/uv", "/Users/jane/projects/ace"),
+    # SCN-HOOKS-003-02: spaces in the project path
+    "SCN-HOOKS-003-02": ("/usr/local/bin/uv", "/Users/John Doe/projects/ace"),
+}
 
 
-def test_scn_all_three_hooks_generated(tmp_path):
-    # @tests SCN-HOOKS-003-03
-    uv_path = "/usr/local/bin/uv"
-    project_dir = "/Users/jane/projects/ace"
-    home = str(tmp_path / "home")
+@pytest.mark.parametrize(
+    "uv_path,project_dir", _COMMAND_FORMAT_CASES.values(),
+    ids=_COMMAND_FORMAT_CASES.keys(),
+)
+def test_command_format(scratch_path, uv_path, project_dir):
+    # @tests REQ-HOOKS-003, SCN-HOOKS-003-01, SCN-HOOKS-003-02, SCN-HOOKS-003-03
+    home = str(scratch_path / "home")
 
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
+        scratch_path, SRC_SETTINGS, uv_path, project_dir,
     )
+    # Every event type gets exactly one command in the full format; both the
+    # project dir and the script path are double-quoted
+    commands_by_event = index_commands(merged)
     for event_name, script_name in EVENT_SCRIPT_MAP.items():
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) == 1, (
             f"Expected exactly 1 command for {event_name}, got {len(commands)}"
         )
-        expected_script = os.path.join(home, ".claude", "hooks", script_name)
-        assert f'python "{expected_script}"' in commands[0]
+        expected_script = hook_script_path(home, script_name)
+        expected = f'{uv_path} run --project "{project_dir}" python "{expected_script}"'
+        assert commands[0] == expected, f"Got: {commands[0]}\nExpected: {expected}"
 
 
 # ---------------------------------------------------------------------------
@@ -340,66 +370,59 @@ def test_scn_all_three_hooks_generated(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_remove_bare_python3_stale(tmp_path):
-    # @tests REQ-HOOKS-005
-    dest = make_settings_with_hooks({
-        "SessionEnd": [
-            ('python3 "/Users/jane/.claude/hooks/session_end.py"', 120),
-        ],
-    })
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
-    )
-    commands = extract_commands(merged, "SessionEnd")
-    assert len(commands) == 1
-    assert "uv run" in commands[0]
-    assert 'python3 "' not in commands[0]
+# (event_name, stale commands) per stale-removal scenario
+_STALE_REMOVAL_CASES = {
+    # SCN-HOOKS-005-01: bare python3 entry
+    "SCN-HOOKS-005-01": ("SessionEnd", [
+        'python3 "/Users/jane/.claude/hooks/session_end.py"',
+    ]),
+    # SCN-HOOKS-005-02: .venv python3 entry
+    "SCN-HOOKS-005-02": ("PreCompact", [
+        '/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/precompact.py"',
+    ]),
+    # SCN-HOOKS-005-03: both kinds for the same script
+    "SCN-HOOKS-005-03": ("UserPromptSubmit", [
+        'python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"',
+        '/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"',
+    ]),
+}
 
 
-def test_remove_venv_python3_stale(tmp_path):
-    # @tests REQ-HOOKS-005
+@pytest.mark.parametrize(
+    "event_name,stale_cmds", _STALE_REMOVAL_CASES.values(),
+    ids=_STALE_REMOVAL_CASES.keys(),
+)
+def test_stale_removal(tmp_path, event_name, stale_cmds):
+    # @tests REQ-HOOKS-005, SCN-HOOKS-005-01, SCN-HOOKS-005-02, SCN-HOOKS-005-03
+    uv_path = "/Users/jane/.local/bin/uv"
     dest = make_settings_with_hooks({
-        "PreCompact": [
-            ('/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/precompact.py"', 120),
-        ],
+        event_name: [(cmd, EVENT_TIMEOUT_MAP[event_name]) for cmd in stale_cmds],
     })
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
+        tmp_path, SRC_SETTINGS, uv_path, "/Users/jane/projects/ace", dest,
     )
-    commands = extract_commands(merged, "PreCompact")
+    commands = extract_commands(merged, event_name)
+    # Exactly one entry for the script after merge: the new uv run command
     assert len(commands) == 1
-    assert "uv run" in commands[0]
+    assert count_project_hooks(merged, event_name, EVENT_SCRIPT_MAP[event_name]) == 1
+    assert commands[0].startswith(f"{uv_path} run --project")
+    assert 'python3 "' not in commands[0]
     assert ".venv/bin/python3" not in commands[0]
 
 
-def test_remove_multiple_stale_same_script(tmp_path):
-    # @tests REQ-HOOKS-005
-    dest = make_settings_with_hooks({
-        "UserPromptSubmit": [
-            ('python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"', 10),
-            ('/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"', 10),
-        ],
-    })
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
-    )
-    commands = extract_commands(merged, "UserPromptSubmit")
-    assert len(commands) == 1
-    assert "uv run" in commands[0]
-
-
 # ---------------------------------------------------------------------------
 # REQ-HOOKS-006: Non-Project Hook Preservation
 # ---------------------------------------------------------------------------
 
 
 def test_preserve_non_project_hooks(tmp_path):
-    # @tests REQ-HOOKS-006
+    # @tests REQ-HOOKS-006, SCN-HOOKS-005-04
     non_project_cmd = 'python3 "/Users/jane/.claude/hooks/document_scanner.py"'
+    stale_cmd = 'python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"'
     dest = json.dumps({
         "hooks": {
             "UserPromptSubmit": [
-                make_hook_group('python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"', timeout=10),
+                make_hook_group(stale_cmd, timeout=10),
                 make_hook_group(non_project_cmd, timeout=30),
             ],
         }
@@ -412,84 +435,17 @@ def test_preserve_non_project_hooks(tmp_path):
     assert non_project_cmd in commands, (
         f"Non-project hook not preserved: {commands}"
     )
+    assert stale_cmd not in commands
     # The new uv run command should also be present
     uv_commands = [c for c in commands if "uv run" in c]
     assert len(uv_commands) == 1
 
 
 # ---------------------------------------------------------------------------
-# SCN-HOOKS-005-*: Stale Removal Scenarios
+# SCN-HOOKS-005-05: Idempotent Re-run
 # ---------------------------------------------------------------------------
 
 
-def test_scn_remove_bare_python3_entry(tmp_path):
-    # @tests SCN-HOOKS-005-01
-    dest = make_settings_with_hooks({
-        "SessionEnd": [
-            ('python3 "/Users/jane/.claude/hooks/session_end.py"', 120),
-        ],
-    })
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/Users/jane/.local/bin/uv",
-        "/Users/jane/projects/ace", dest,
-    )
-    commands = extract_commands(merged, "SessionEnd")
-    assert len(commands) == 1
-    assert "/Users/jane/.local/bin/uv run --project" in commands[0]
-
-
-def test_scn_remove_venv_python3_entry(tmp_path):
-    # @tests SCN-HOOKS-005-02
-    dest = make_settings_with_hooks({
-        "PreCompact": [
-            ('/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/precompact.py"', 120),
-        ],
-    })
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
-    )
-    commands = extract_commands(merged, "PreCompact")
-    assert len(commands) == 1
-    assert "uv run" in commands[0]
-
-
-def test_scn_remove_multiple_stale_entries(tmp_path):
-    # @tests SCN-HOOKS-005-03
-    dest = make_settings_with_hooks({
-        "UserPromptSubmit": [
-            ('python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"', 10),
-            ('/Users/jane/.claude/.venv/bin/python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"', 10),
-        ],
-    })
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
-    )
-    # Exactly one entry for user_prompt_inject after merge
-    count = count_project_hooks(merged, "UserPromptSubmit", "user_prompt_inject.py")
-    assert count == 1
-
-
-def test_scn_preserve_non_project_hook(tmp_path):
-    # @tests SCN-HOOKS-005-04
-    non_project_cmd = 'python3 "/Users/jane/.claude/hooks/document_scanner.py"'
-    stale_cmd = 'python3 "/Users/jane/.claude/hooks/user_prompt_inject.py"'
-    dest = json.dumps({
-        "hooks": {
-            "UserPromptSubmit": [
-                make_hook_group(stale_cmd, timeout=10),
-                make_hook_group(non_project_cmd, timeout=30),
-            ],
-        }
-    }, indent=2)
-    merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
-    )
-    commands = extract_commands(merged, "UserPromptSubmit")
-    assert non_project_cmd in commands
-    # Stale project hook should be gone
-    assert stale_cmd not in commands
-
-
 def test_scn_idempotent_rerun(tmp_path):
     # @tests SCN-HOOKS-005-05
     uv_path = "/usr/local/bin/uv"
@@ -499,16 +455,9 @@ def test_scn_idempotent_rerun(tmp_path):
     merged1 = call_merge_settings(
         tmp_path, SRC_SETTINGS, uv_path, project_dir,
     )
-    # Write the result as the "pre-existing" destination for the second run.
-    # Use the same tmp_path so HOME resolves identically for both runs.
-    home_dir = str(tmp_path / "home")
-    dest_settings_path = os.path.join(home_dir, ".claude", "settings.json")
-    with open(dest_settings_path, "w") as f:
-        json.dump(merged1, f, indent=2)
-
-    # Second run: re-run with the output of the first run as destination.
-    # Rewriting the helper.js in the same tmp_path is fine -- call_merge_settings
-    # overwrites it each time.
+    # Second run: re-run with the output of the first run as the
+    # "pre-existing" destination. Use the same tmp_path so HOME resolves
+    # identically for both runs.
     merged2 = call_merge_settings(
         tmp_path, SRC_SETTINGS, uv_path, project_dir,
         dest_settings_content=json.dumps(merged1, indent=2),
@@ -582,29 +531,29 @@ def test_invariant_non_project_hooks_never_modified(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_invariant_all_paths_absolute(tmp_path):
+def test_invariant_all_paths_absolute(scratch_path):
     # @tests-invariant INV-HOOKS-003
     uv_path = "/opt/homebrew/bin/uv"
     project_dir = "/Users/jane/projects/ace"
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, project_dir,
+        scratch_path, SRC_SETTINGS, uv_path, project_dir,
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         for cmd in commands:
             # The command starts with the absolute uv path
             assert cmd.startswith("/"), (
                 f"Command does not start with absolute path: {cmd}"
             )
             # Check that --project arg is absolute (inside double quotes)
-            import re
-            project_match = re.search(r'--project "([^"]+)"', cmd)
+            project_match = _PROJECT_ARG_RE.search(cmd)
             assert project_match, f"No --project arg found in: {cmd}"
             assert project_match.group(1).startswith("/"), (
                 f"Project dir is not absolute: {project_match.group(1)}"
             )
             # Check that script path is absolute (inside double quotes after python)
-            script_match = re.search(r'python "([^"]+)"', cmd)
+            script_match = _SCRIPT_ARG_RE.search(cmd)
             assert script_match, f"No script path found in: {cmd}"
             assert script_match.group(1).startswith("/"), (
                 f"Script path is not absolute: {script_match.group(1)}"
@@ -637,10 +586,10 @@ def test_invariant_non_hook_settings_preserved(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_invariant_hook_timeouts_correct(tmp_path):
+def test_invariant_hook_timeouts_correct(scratch_path):
     # @tests-invariant INV-HOOKS-006
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj",
+        scratch_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj",
     )
     for event_name, expected_timeout in EVENT_TIMEOUT_MAP.items():
         groups = merged.get("hooks", {}).get(event_name, [])
@@ -658,13 +607,13 @@ def test_invariant_hook_timeouts_correct(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_invariant_output_is_valid_json(tmp_path):
+def test_invariant_output_is_valid_json(scratch_path):
     # @tests-invariant INV-HOOKS-007
     # Use a path with spaces AND double quotes to stress JSON escaping.
     # The command strings contain double-quoted paths (e.g., python "/path/my project/...")
     # which must be properly escaped as \" in the JSON serialization.
     result = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/home/user/bin/uv", "/proj/my project",
+        scratch_path, SRC_SETTINGS, "/home/user/bin/uv", "/proj/my project",
     )
 
     # Verify round-trip integrity
@@ -694,14 +643,15 @@ def test_invariant_output_is_valid_json(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_absolute_uv_path_embedded(tmp_path):
+def test_absolute_uv_path_embedded(scratch_path):
     # @tests REQ-HOOKS-008
     uv_path = "/Users/jane/.local/bin/uv"
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, "/proj",
+        scratch_path, SRC_SETTINGS, uv_path, "/proj",
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         for cmd in commands:
             assert cmd.startswith(uv_path + " "), (
                 f"Command does not start with absolute uv path: {cmd}"
@@ -712,41 +662,30 @@ def test_absolute_uv_path_embedded(tmp_path):
             )
 
 
-def test_scn_uv_path_trimmed(tmp_path):
+def test_scn_uv_path_trimmed(tmp_path, fake_uv_bin):
     # @tests SCN-HOOKS-008-01
     # SCN-HOOKS-008-01 is about install()'s `execSync('which uv').toString().trim()`
     # call. Since mergeSettings takes the already-trimmed path, we test the full
-    # install() function via subprocess with a fake `uv` whose `which` output
+    # install() function via the node worker with a fake `uv` whose `which` output
     # contains a trailing newline (as real `which` does). We then verify the
     # resulting settings.json command uses the trimmed path with no trailing
     # whitespace.
     home_dir = str(tmp_path / "home")
     claude_dir = os.path.join(home_dir, ".claude")
-    hooks_dir = os.path.join(claude_dir, "hooks")
-    bin_dir = str(tmp_path / "bin")
 
-    os.makedirs(hooks_dir, exist_ok=True)
-    os.makedirs(bin_dir, exist_ok=True)
-
-    # Create a fake uv script. `which uv` will return the absolute path
-    # with a trailing newline (this is normal `which` behavior). The install.js
-    # code calls .trim() to remove it. We verify the generated command uses the
+    # The session's fake uv: `which uv` returns its absolute path with a
+    # trailing newline (this is normal `which` behavior). The install.js code
+    # calls .trim() to remove it. We verify the generated command uses the
     # trimmed path.
-    fake_uv = os.path.join(bin_dir, "uv")
-    with open(fake_uv, "w") as f:
-        f.write("#!/bin/bash\n")
-        f.write('if [[ "$1" == "sync" ]]; then exit 0; fi\n')
-        f.write("exit 0\n")
-    os.chmod(fake_uv, 0o755)
+    fake_uv = os.path.join(fake_uv_bin, "uv")
 
-    env = os.environ.copy()
-    env["HOME"] = home_dir
-    env["PATH"] = bin_dir + os.pathsep + env.get("PATH", "")
+    env = {
+        **_BASE_ENV,
+        "HOME": home_dir,
+        "PATH": fake_uv_bin + os.pathsep + _INHERITED_PATH,
+    }
 
-    result = subprocess.run(
-        ["node", INSTALL_JS],
-        capture_output=True, text=True, env=env, timeout=30,
-    )
+    result = _run_install(env)
     assert result.returncode == 0, f"Install failed: {result.stderr}"
 
     settings_path = os.path.join(claude_dir, "settings.json")
@@ -772,14 +711,15 @@ def test_scn_uv_path_trimmed(tmp_path):
                 )
 
 
-def test_scn_uv_homebrew_path(tmp_path):
+def test_scn_uv_homebrew_path(scratch_path):
     # @tests SCN-HOOKS-008-02
     uv_path = "/opt/homebrew/bin/uv"
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, uv_path, "/proj",
+        scratch_path, SRC_SETTINGS, uv_path, "/proj",
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert all(
             cmd.startswith("/opt/homebrew/bin/uv run --project") for cmd in commands
         )
@@ -799,8 +739,9 @@ def test_adversarial_malformed_json_dest(tmp_path):
     )
     # mergeSettings should handle gracefully -- treat as empty and add new hooks
     assert "hooks" in merged
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) >= 1
 
 
@@ -811,8 +752,9 @@ def test_adversarial_missing_hooks_key(tmp_path):
         tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
     )
     assert "hooks" in merged
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) >= 1
 
 
@@ -823,8 +765,9 @@ def test_adversarial_null_hooks(tmp_path):
         tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
     )
     assert "hooks" in merged
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) >= 1
 
 
@@ -835,8 +778,9 @@ def test_adversarial_empty_hooks(tmp_path):
         tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
     )
     assert "hooks" in merged
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) >= 1
 
 
@@ -912,15 +856,16 @@ def test_adversarial_hook_entry_missing_command(tmp_path):
         ), f"Unexpected error for missing-command input: {exc}"
 
 
-def test_adversarial_fresh_install_no_prior_settings(tmp_path):
+def test_adversarial_fresh_install_no_prior_settings(scratch_path):
     # @tests REQ-HOOKS-005 (TC-BOUND-001, TC-BOUND-002)
     # No pre-existing settings.json at all
     merged = call_merge_settings(
-        tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj",
+        scratch_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj",
     )
     assert "hooks" in merged
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) == 1
         assert "uv run" in commands[0]
 
@@ -937,8 +882,9 @@ def test_adversarial_empty_hook_arrays(tmp_path):
     merged = call_merge_settings(
         tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) == 1
         assert "uv run" in commands[0]
 
@@ -959,8 +905,9 @@ def test_adversarial_stale_across_all_event_types(tmp_path):
     merged = call_merge_settings(
         tmp_path, SRC_SETTINGS, "/usr/local/bin/uv", "/proj", dest,
     )
+    commands_by_event = index_commands(merged)
     for event_name in EVENT_SCRIPT_MAP:
-        commands = extract_commands(merged, event_name)
+        commands = commands_by_event.get(event_name, [])
         assert len(commands) == 1
         assert "uv run" in commands[0]
         assert "python3" not in commands[0].split("python")[0]  # no python3 prefix
@@ -1010,77 +957,69 @@ def test_adversarial_pre_existing_non_hook_settings_preserved(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def _setup_install_env(tmp_path, *, fake_uv_sync_exit=0, include_uv=True,
+def _setup_install_env(tmp_path, fake_uv_bin=None, *, fake_uv_sync_exit=0,
                        pre_existing_settings=None):
     """
-    Set up a temp environment to run `node install.js` as a subprocess.
+    Set up a temp environment to run install() as `node install.js` would.
 
     Args:
         tmp_path: pytest tmp_path fixture
+        fake_uv_bin: the session's fake_uv_bin directory; None leaves uv off PATH
         fake_uv_sync_exit: exit code for fake uv sync (0=success)
-        include_uv: if False, PATH will not include a uv binary
         pre_existing_settings: optional string content for settings.json
 
     Returns:
         (env_dict, home_dir, settings_path, bin_dir)
     """
     home_dir = str(tmp_path / "home")
-    claude_dir = os.path.join(home_dir, ".claude")
-    hooks_dir = os.path.join(claude_dir, "hooks")
-    settings_path = os.path.join(claude_dir, "settings.json")
-    bin_dir = str(tmp_path / "bin")
-
-    os.makedirs(hooks_dir, exist_ok=True)
-    os.makedirs(bin_dir, exist_ok=True)
+    settings_path = os.path.join(home_dir, ".claude", "settings.json")
 
+    # ~/.claude is left for install() to create unless a test seeds settings
     if pre_existing_settings is not None:
-        with open(settings_path, "w") as f:
-            f.write(pre_existing_settings)
-
-    env = os.environ.copy()
-    env["HOME"] = home_dir
-    if platform.system() == "Windows":
-        env["USERPROFILE"] = home_dir
-
-    if include_uv:
-        # Create fake uv binary
-        fake_uv = os.path.join(bin_dir, "uv")
-        with open(fake_uv, "w") as f:
-            f.write("#!/bin/bash\n")
-            f.write(f'if [[ "$1" == "sync" ]]; then exit {fake_uv_sync_exit}; fi\n')
-            f.write("exit 0\n")
-        os.chmod(fake_uv, 0o755)
-        env["PATH"] = bin_dir + os.pathsep + env.get("PATH", "")
+        seeded = pathlib.Path(settings_path)
+        seeded.parent.mkdir(parents=True)
+        seeded.write_text(pre_existing_settings)
+
+    # USERPROFILE is what os.homedir() reads on Windows; harmless elsewhere
+    env = {**_BASE_ENV, "HOME": home_dir, "USERPROFILE": home_dir}
+
+    if fake_uv_bin is not None:
+        env["PATH"] = fake_uv_bin + os.pathsep + _INHERITED_PATH
+        env["FAKE_UV_SYNC_EXIT"] = str(fake_uv_sync_exit)
     else:
         # PATH with NO uv: just the directory containing node + system dirs
-        _node_bin = shutil.which("node")
-        _node_dir = os.path.dirname(_node_bin) if _node_bin else "/usr/local/bin"
-        env["PATH"] = os.pathsep.join([_node_dir, "/usr/bin", "/bin"])
+        env["PATH"] = _PATH_WITHOUT_UV
 
-    return env, home_dir, settings_path, bin_dir
+    return env, home_dir, settings_path, fake_uv_bin
 
 
 def _run_install(env, timeout=30):
-    """Run node install.js with the given environment and return the result."""
-    return subprocess.run(
-        ["node", INSTALL_JS],
-        capture_output=True,
-        text=True,
-        env=env,
-        timeout=timeout,
+    """
+    Run install.js's install() in the session's node worker with the given
+    environment and return the result as a CompletedProcess.
+
+    No `node install.js` process runs: args name the worker request, and
+    returncode is the code the worker's stubbed process.exit recorded.
+    """
+    reply = _node_worker.request({"op": "install", "env": env}, timeout=timeout)
+    if "__error__" in reply:
+        raise RuntimeError(f"install worker failed: {reply['__error__']}")
+    return subprocess.CompletedProcess(
+        [_NODE_BIN, HELPER_JS, "install"],
+        reply["returncode"], reply["stdout"], reply["stderr"],
     )
 
 
 # ---------------------------------------------------------------------------
-# REQ-HOOKS-007: uv Not Found Error Handling (Subprocess Tests)
+# REQ-HOOKS-007: uv Not Found Error Handling (install() Tests)
 # ---------------------------------------------------------------------------
 
 
 def test_uv_not_found_exits_nonzero(tmp_path):
     # @tests REQ-HOOKS-007
-    # Run node install.js via subprocess with no uv on PATH, check exit code 1
+    # Run install() with no uv on PATH, check exit code 1
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, include_uv=False,
+        tmp_path,
     )
     result = _run_install(env)
     assert result.returncode == 1, (
@@ -1090,10 +1029,10 @@ def test_uv_not_found_exits_nonzero(tmp_path):
 
 def test_uv_not_found_stderr_message(tmp_path):
     # @tests REQ-HOOKS-007
-    # Run node install.js via subprocess with no uv on PATH,
+    # Run install() with no uv on PATH,
     # check exact stderr contains the full error message from REQ-HOOKS-007
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, include_uv=False,
+        tmp_path,
     )
     result = _run_install(env)
     assert result.returncode == 1
@@ -1119,7 +1058,7 @@ def test_scn_uv_not_installed_error(tmp_path):
     # Exact error text, exit code 1, no files modified
     pre_settings = json.dumps({"existing": "untouched"}, indent=2)
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, include_uv=False, pre_existing_settings=pre_settings,
+        tmp_path, pre_existing_settings=pre_settings,
     )
     result = _run_install(env)
 
@@ -1144,7 +1083,7 @@ def test_scn_uv_check_before_file_operations(tmp_path):
     # Run without uv, verify settings.json UNCHANGED
     pre_settings = json.dumps({"hooks": {"SessionEnd": []}}, indent=2)
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, include_uv=False, pre_existing_settings=pre_settings,
+        tmp_path, pre_existing_settings=pre_settings,
     )
 
     # Record the byte content before
@@ -1161,11 +1100,10 @@ def test_scn_uv_check_before_file_operations(tmp_path):
         "settings.json was modified despite uv check failing before file operations"
     )
 
-    # No new files in ~/.claude/hooks/
+    # No ~/.claude/hooks/ created, so nothing was copied
     hooks_dir = os.path.join(home_dir, ".claude", "hooks")
-    hook_files = os.listdir(hooks_dir)
-    assert len(hook_files) == 0, (
-        f"Files were copied to hooks dir despite uv-not-found: {hook_files}"
+    assert not os.path.exists(hooks_dir), (
+        f"Files were copied to hooks dir despite uv-not-found: {os.listdir(hooks_dir)}"
     )
 
 
@@ -1178,7 +1116,7 @@ def test_invariant_no_file_modification_on_uv_not_found(tmp_path):
         "customKey": True,
     }, indent=2)
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, include_uv=False, pre_existing_settings=pre_settings,
+        tmp_path, pre_existing_settings=pre_settings,
     )
 
     with open(settings_path, "rb") as f:
@@ -1195,15 +1133,15 @@ def test_invariant_no_file_modification_on_uv_not_found(tmp_path):
 
 
 # ---------------------------------------------------------------------------
-# REQ-HOOKS-009: Pre-Install Dependency Sync (Subprocess Tests)
+# REQ-HOOKS-009: Pre-Install Dependency Sync (install() Tests)
 # ---------------------------------------------------------------------------
 
 
-def test_uv_sync_runs_before_file_ops(tmp_path):
+def test_uv_sync_runs_before_file_ops(tmp_path, fake_uv_bin):
     # @tests REQ-HOOKS-009
     # Fake uv sync succeeds; verify install continues and produces settings
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, fake_uv_sync_exit=0,
+        tmp_path, fake_uv_bin, fake_uv_sync_exit=0,
     )
     result = _run_install(env)
     assert result.returncode == 0, f"Install failed: {result.stderr}"
@@ -1219,12 +1157,12 @@ def test_uv_sync_runs_before_file_ops(tmp_path):
         )
 
 
-def test_uv_sync_failure_aborts(tmp_path):
+def test_uv_sync_failure_aborts(tmp_path, fake_uv_bin):
     # @tests REQ-HOOKS-009
     # Fake uv sync fails; verify exit code 1
     pre_settings = json.dumps({"existing": "value"}, indent=2)
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, fake_uv_sync_exit=2, pre_existing_settings=pre_settings,
+        tmp_path, fake_uv_bin, fake_uv_sync_exit=2, pre_existing_settings=pre_settings,
     )
     result = _run_install(env)
     assert result.returncode == 1, (
@@ -1239,11 +1177,11 @@ def test_uv_sync_failure_aborts(tmp_path):
     )
 
 
-def test_scn_uv_sync_succeeds(tmp_path):
+def test_scn_uv_sync_succeeds(tmp_path, fake_uv_bin):
     # @tests SCN-HOOKS-009-01
     # uv sync exits 0, install continues, file is written
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, fake_uv_sync_exit=0,
+        tmp_path, fake_uv_bin, fake_uv_sync_exit=0,
     )
     result = _run_install(env)
     assert result.returncode == 0, f"Install failed: {result.stderr}"
@@ -1266,12 +1204,12 @@ def test_scn_uv_sync_succeeds(tmp_path):
         assert script_name in commands[0]
 
 
-def test_scn_uv_sync_fails_with_error_message(tmp_path):
+def test_scn_uv_sync_fails_with_error_message(tmp_path, fake_uv_bin):
     # @tests SCN-HOOKS-009-02
     # uv sync exits non-zero; stderr includes "uv sync failed", exit code value,
     # and the "Try running manually" suggestion
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, fake_uv_sync_exit=2,
+        tmp_path, fake_uv_bin, fake_uv_sync_exit=2,
     )
     result = _run_install(env)
     assert result.returncode == 1
@@ -1294,7 +1232,7 @@ def test_scn_uv_sync_fails_with_error_message(tmp_path):
     )
 
 
-def test_invariant_no_file_modification_on_uv_sync_failure(tmp_path):
+def test_invariant_no_file_modification_on_uv_sync_failure(tmp_path, fake_uv_bin):
     # @tests-invariant INV-HOOKS-004
     # settings.json UNCHANGED when uv sync fails
     pre_settings = json.dumps({
@@ -1302,7 +1240,7 @@ def test_invariant_no_file_modification_on_uv_sync_failure(tmp_path):
                    "command": "original", "timeout": 120}]}]},
     }, indent=2)
     env, home_dir, settings_path, _ = _setup_install_env(
-        tmp_path, fake_uv_sync_exit=2, pre_existing_settings=pre_settings,
+        tmp_path, fake_uv_bin, fake_uv_sync_exit=2, pre_existing_settings=pre_settings,
     )
 
     with open(settings_path, "rb") as f:
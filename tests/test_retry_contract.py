@@ -10,11 +10,10 @@ implementation details, or design.md. They verify only behaviors
 promised by the data contracts.
 """
 
-import asyncio
 import inspect
 import sys
 import time
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import anthropic
@@ -34,6 +33,43 @@ from src.hooks.common import extract_keypoints
 VALID_JSON = '{"new_key_points": ["insight"], "evaluations": [{"name": "pat-001", "rating": "helpful"}]}'
 EMPTY_JSON = '{"new_key_points": [], "evaluations": []}'
 
+# Exception classes of the real anthropic module, copied onto each fake
+# module; collected once since they never change during a run
+_ANTHROPIC_EXCEPTIONS = {
+    attr_name: obj
+    for attr_name, obj in vars(anthropic).items()
+    if isinstance(obj, type) and issubclass(obj, BaseException)
+}
+
+# Error instances for the classification tests, keyed by test id and built
+# once per module; they are only raised, never mutated
+_RETRYABLE_ERRORS = {
+    "timeout": anthropic.APITimeoutError(request=MagicMock()),
+    "connection": anthropic.APIConnectionError(request=MagicMock()),
+    "rate_limit": anthropic.RateLimitError(
+        message="rate limited", response=MagicMock(status_code=429, headers={}), body={}
+    ),
+    "server_error": anthropic.InternalServerError(
+        message="server error", response=MagicMock(status_code=500, headers={}), body={}
+    ),
+}
+
+_NON_RETRYABLE_ERRORS = {
+    "auth": anthropic.AuthenticationError(
+        message="auth failed", response=MagicMock(status_code=401, headers={}), body={}
+    ),
+    "bad_request": anthropic.BadRequestError(
+        message="bad request", response=MagicMock(status_code=400, headers={}), body={}
+    ),
+    "not_found": anthropic.NotFoundError(
+        message="not found", response=MagicMock(status_code=404, headers={}), body={}
+    ),
+    "response_validation": anthropic.APIResponseValidationError(
+        response=MagicMock(status_code=200, headers={}), body={}, message="validation failed"
+    ),
+    "runtime": RuntimeError("unexpected"),
+}
+
 
 def _setup_retry_mocks(monkeypatch):
     """Minimal mock setup for contract tests.
@@ -49,36 +85,25 @@ def _setup_retry_mocks(monkeypatch):
         lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
     )
 
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = VALID_JSON
-    mock_response.content = [mock_text_block]
-
     mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
+    mock_client.messages.create.return_value = _make_mock_response(VALID_JSON)
 
     mock_anthropic_cls = MagicMock(return_value=mock_client)
     fake_anthropic = ModuleType("anthropic")
+    vars(fake_anthropic).update(_ANTHROPIC_EXCEPTIONS)
     setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
-    # Copy exception classes from real anthropic module
-    for attr_name in dir(anthropic):
-        obj = getattr(anthropic, attr_name)
-        if isinstance(obj, type) and issubclass(obj, BaseException):
-            setattr(fake_anthropic, attr_name, obj)
     monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
 
     return mock_client
 
 
 def _make_mock_response(json_text):
-    """Create a mock response object with content[0].text = json_text."""
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = json_text
-    mock_response.content = [mock_text_block]
-    return mock_response
+    """Create a stand-in response object with content[0].text = json_text.
+
+    extract_keypoints only reads content[].type / .text, so plain
+    namespaces serve; messages.create itself stays a MagicMock.
+    """
+    return SimpleNamespace(content=[SimpleNamespace(type="text", text=json_text)])
 
 
 # ---------------------------------------------------------------------------
@@ -86,6 +111,13 @@ def _make_mock_response(json_text):
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    """Make backoff sleeps no-ops and pin jitter to 1.0."""
+    monkeypatch.setattr(time, "sleep", lambda d: None)
+    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
+
+
 @pytest.fixture
 def project_dir(tmp_path, monkeypatch):
     """Set CLAUDE_PROJECT_DIR to a temp directory with .claude/ structure."""
@@ -109,11 +141,9 @@ def enable_diagnostic(project_dir):
 
 
 # @tests-contract REQ-RETRY-001
-def test_contract_retry_returns_result_after_transient_failure(monkeypatch, project_dir):
+def test_contract_retry_returns_result_after_transient_failure(monkeypatch, project_dir, run_async):
     """Contract: extract_keypoints returns valid result after transient API failure."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     # First call fails (retryable), second succeeds
     mock_client.messages.create.side_effect = [
@@ -121,7 +151,7 @@ def test_contract_retry_returns_result_after_transient_failure(monkeypatch, proj
         _make_mock_response(VALID_JSON),
     ]
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: returns a dict with new_key_points and evaluations
     assert isinstance(result, dict)
@@ -137,19 +167,19 @@ def test_contract_retry_returns_result_after_transient_failure(monkeypatch, proj
 
 
 # @tests-contract REQ-RETRY-002
-def test_contract_backoff_no_immediate_retry(monkeypatch, project_dir):
+def test_contract_backoff_no_immediate_retry(monkeypatch, project_dir, run_async):
     """Contract: backoff delay occurs between retry attempts (time.sleep is called)."""
     mock_client = _setup_retry_mocks(monkeypatch)
+    # Overrides the autouse no-op sleep to observe backoff delays
     sleep_called = []
     monkeypatch.setattr(time, "sleep", lambda d: sleep_called.append(d))
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APITimeoutError(request=MagicMock()),
         _make_mock_response(VALID_JSON),
     ]
 
-    asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: at least one backoff delay occurred (not immediate retry)
     assert len(sleep_called) >= 1
@@ -162,40 +192,25 @@ def test_contract_backoff_no_immediate_retry(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-003
-def test_contract_retryable_errors_are_retried(monkeypatch, project_dir):
+@pytest.mark.parametrize(
+    "error", _RETRYABLE_ERRORS.values(), ids=_RETRYABLE_ERRORS.keys()
+)
+def test_contract_retryable_errors_are_retried(monkeypatch, project_dir, run_async, error):
     """Contract: retryable errors do not cause immediate failure; function returns valid result."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
-    # Each retryable error type followed by success
-    retryable_errors = [
-        anthropic.APITimeoutError(request=MagicMock()),
-        anthropic.APIConnectionError(request=MagicMock()),
-        anthropic.RateLimitError(
-            message="rate limited", response=MagicMock(status_code=429, headers={}), body={}
-        ),
-        anthropic.InternalServerError(
-            message="server error", response=MagicMock(status_code=500, headers={}), body={}
-        ),
+    # The retryable error followed by success
+    mock_client.messages.create.side_effect = [
+        error,
+        _make_mock_response(VALID_JSON),
     ]
 
-    for error in retryable_errors:
-        mock_client = _setup_retry_mocks(monkeypatch)
-        monkeypatch.setattr(time, "sleep", lambda d: None)
-        monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
-        mock_client.messages.create.side_effect = [
-            error,
-            _make_mock_response(VALID_JSON),
-        ]
-
-        result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
-
-        # Contract: function returns valid result (not empty) when retryable error recovers
-        assert isinstance(result, dict)
-        assert "new_key_points" in result
-        assert "evaluations" in result
+    # Contract: function returns valid result (not empty) when retryable error recovers
+    assert isinstance(result, dict)
+    assert "new_key_points" in result
+    assert "evaluations" in result
 
 
 # ===========================================================================
@@ -204,36 +219,18 @@ def test_contract_retryable_errors_are_retried(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-004
-def test_contract_non_retryable_returns_empty(monkeypatch, project_dir):
+@pytest.mark.parametrize(
+    "error", _NON_RETRYABLE_ERRORS.values(), ids=_NON_RETRYABLE_ERRORS.keys()
+)
+def test_contract_non_retryable_returns_empty(monkeypatch, project_dir, run_async, error):
     """Contract: non-retryable errors return the empty result dict immediately."""
-    non_retryable_errors = [
-        anthropic.AuthenticationError(
-            message="auth failed", response=MagicMock(status_code=401, headers={}), body={}
-        ),
-        anthropic.BadRequestError(
-            message="bad request", response=MagicMock(status_code=400, headers={}), body={}
-        ),
-        anthropic.NotFoundError(
-            message="not found", response=MagicMock(status_code=404, headers={}), body={}
-        ),
-        anthropic.APIResponseValidationError(
-            response=MagicMock(status_code=200, headers={}), body={}, message="validation failed"
-        ),
-        RuntimeError("unexpected"),
-    ]
-
-    for error in non_retryable_errors:
-        mock_client = _setup_retry_mocks(monkeypatch)
-        monkeypatch.setattr(time, "sleep", lambda d: None)
-
-        mock_client.messages.create.side_effect = error
+    mock_client = _setup_retry_mocks(monkeypatch)
+    mock_client.messages.create.side_effect = error
 
-        result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
-        # Contract: returns empty result dict
-        assert result == {"new_key_points": [], "evaluations": []}, (
-            f"Expected empty result for {type(error).__name__}"
-        )
+    # Contract: returns empty result dict
+    assert result == {"new_key_points": [], "evaluations": []}
 
 
 # ===========================================================================
@@ -242,11 +239,9 @@ def test_contract_non_retryable_returns_empty(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-005
-def test_contract_exhaustion_returns_empty(monkeypatch, project_dir):
+def test_contract_exhaustion_returns_empty(monkeypatch, project_dir, run_async):
     """Contract: when all retry attempts fail, returns empty result dict."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APITimeoutError(request=MagicMock()),
@@ -254,7 +249,7 @@ def test_contract_exhaustion_returns_empty(monkeypatch, project_dir):
         anthropic.APITimeoutError(request=MagicMock()),
     ]
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: returns empty result, no exception propagated
     assert result == {"new_key_points": [], "evaluations": []}
@@ -266,13 +261,13 @@ def test_contract_exhaustion_returns_empty(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-006
-def test_contract_timeout_parameter_set(monkeypatch, project_dir):
+def test_contract_timeout_parameter_set(monkeypatch, project_dir, run_async):
     """Contract: client.messages.create is called with timeout=30.0."""
     mock_client = _setup_retry_mocks(monkeypatch)
 
     mock_client.messages.create.return_value = _make_mock_response(VALID_JSON)
 
-    asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: timeout=30.0 passed as keyword argument
     call_args = mock_client.messages.create.call_args
@@ -285,11 +280,9 @@ def test_contract_timeout_parameter_set(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-007
-def test_contract_no_diagnostic_when_mode_off(monkeypatch, project_dir):
+def test_contract_no_diagnostic_when_mode_off(monkeypatch, project_dir, run_async):
     """Contract: no diagnostic logging occurs when diagnostic mode is off."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     diag_calls = []
     monkeypatch.setattr(
@@ -304,7 +297,7 @@ def test_contract_no_diagnostic_when_mode_off(monkeypatch, project_dir):
         _make_mock_response(VALID_JSON),
     ]
 
-    asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: no diagnostic calls when mode is off
     assert len(diag_calls) == 0
@@ -332,11 +325,9 @@ def test_contract_module_constants_accessible():
 
 
 # @tests-contract REQ-RETRY-001
-def test_contract_deliverable_retry_succeeds(monkeypatch, project_dir):
+def test_contract_deliverable_retry_succeeds(monkeypatch, project_dir, run_async):
     """Deliverable: transient failure then success -- no exception propagated to caller."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APITimeoutError(request=MagicMock()),
@@ -344,7 +335,7 @@ def test_contract_deliverable_retry_succeeds(monkeypatch, project_dir):
     ]
 
     # Caller perspective: call function, get result, no crash
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     assert isinstance(result, dict)
     assert "new_key_points" in result
@@ -356,11 +347,9 @@ def test_contract_deliverable_retry_succeeds(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-005
-def test_contract_deliverable_exhaustion_graceful(monkeypatch, project_dir):
+def test_contract_deliverable_exhaustion_graceful(monkeypatch, project_dir, run_async):
     """Deliverable: all attempts fail -- returns empty dict, no exception to caller."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APITimeoutError(request=MagicMock()),
@@ -371,18 +360,18 @@ def test_contract_deliverable_exhaustion_graceful(monkeypatch, project_dir):
     ]
 
     # Caller perspective: no crash, get empty result
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     assert isinstance(result, dict)
     assert result == {"new_key_points": [], "evaluations": []}
 
 
 # @tests-contract REQ-RETRY-001
-def test_contract_deliverable_anthropic_not_available(monkeypatch, project_dir):
+def test_contract_deliverable_anthropic_not_available(monkeypatch, project_dir, run_async):
     """Deliverable: ANTHROPIC_AVAILABLE=False -- early return with empty result."""
     monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", False)
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     assert isinstance(result, dict)
     assert result == {"new_key_points": [], "evaluations": []}
@@ -401,11 +390,9 @@ def test_contract_function_signature():
 
 
 # @tests-contract REQ-RETRY-003
-def test_contract_api_status_error_5xx_retried(monkeypatch, project_dir):
+def test_contract_api_status_error_5xx_retried(monkeypatch, project_dir, run_async):
     """Contract: APIStatusError with status >= 500 is treated as retryable."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APIStatusError(
@@ -416,7 +403,7 @@ def test_contract_api_status_error_5xx_retried(monkeypatch, project_dir):
         _make_mock_response(VALID_JSON),
     ]
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: function returns a valid result after retryable 5xx recovers
     assert isinstance(result, dict)
@@ -424,33 +411,30 @@ def test_contract_api_status_error_5xx_retried(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-004
-def test_contract_api_status_error_4xx_not_retried(monkeypatch, project_dir):
+def test_contract_api_status_error_4xx_not_retried(monkeypatch, project_dir, run_async):
     """Contract: APIStatusError with status < 500 returns empty immediately."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
 
     mock_client.messages.create.side_effect = anthropic.NotFoundError(
         message="not found", response=MagicMock(status_code=404, headers={}), body={}
     )
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    result = run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     assert result == {"new_key_points": [], "evaluations": []}
 
 
 # @tests-contract REQ-RETRY-006
-def test_contract_timeout_on_retry_attempt(monkeypatch, project_dir):
+def test_contract_timeout_on_retry_attempt(monkeypatch, project_dir, run_async):
     """Contract: timeout=30.0 is set on retry attempts as well, not just the first."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     mock_client.messages.create.side_effect = [
         anthropic.APITimeoutError(request=MagicMock()),
         _make_mock_response(VALID_JSON),
     ]
 
-    asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: every call has timeout=30.0
     for call in mock_client.messages.create.call_args_list:
@@ -458,11 +442,9 @@ def test_contract_timeout_on_retry_attempt(monkeypatch, project_dir):
 
 
 # @tests-contract REQ-RETRY-007
-def test_contract_diagnostic_logged_when_mode_on(monkeypatch, project_dir, enable_diagnostic):
+def test_contract_diagnostic_logged_when_mode_on(monkeypatch, project_dir, enable_diagnostic, run_async):
     """Contract: diagnostic logging occurs when diagnostic mode is on during retry events."""
     mock_client = _setup_retry_mocks(monkeypatch)
-    monkeypatch.setattr(time, "sleep", lambda d: None)
-    monkeypatch.setattr("random.uniform", lambda a, b: 1.0)
 
     diag_calls = []
     monkeypatch.setattr(
@@ -476,7 +458,7 @@ def test_contract_diagnostic_logged_when_mode_on(monkeypatch, project_dir, enabl
         _make_mock_response(VALID_JSON),
     ]
 
-    asyncio.run(extract_keypoints(messages=[], playbook={"sections": {}}))
+    run_async(extract_keypoints(messages=[], playbook={"sections": {}}))
 
     # Contract: at least one retry-related diagnostic was emitted
     retry_diags = [c for c in diag_calls if c[1] == "retry_extract_keypoints"]
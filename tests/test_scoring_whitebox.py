@@ -494,6 +494,21 @@ def test_pruning_retains_below_floor(project_dir):
     assert len(result["sections"]["OTHERS"]) == 1
 
 
+# @tests REQ-SCORE-007
+def test_pruning_leaves_unaffected_section_lists_in_place(project_dir):
+    """Only sections that lose an entry get a new list; the rest are untouched."""
+    playbook = _make_playbook([
+        {"name": "kpt_001", "text": "bad advice", "helpful": 0, "harmful": 5},
+    ])
+    playbook["sections"]["PATTERNS & APPROACHES"] = [
+        {"name": "pat-001", "text": "fine", "helpful": 1, "harmful": 0},
+    ]
+    pat_list = playbook["sections"]["PATTERNS & APPROACHES"]
+    result = update_playbook_data(playbook, _make_extraction())
+    assert result["sections"]["OTHERS"] == []
+    assert result["sections"]["PATTERNS & APPROACHES"] is pat_list
+
+
 # @tests SCN-SCORE-007-01
 def test_scn_prune_consistently_harmful(project_dir):
     """SCN-SCORE-007-01: Consistently harmful entry is pruned."""
@@ -9,19 +9,14 @@ They do NOT reference internal branches, implementation details, or design.md.
 They verify only behaviors promised by the data contracts.
 """
 
-import asyncio
 import json
 import sys
-from types import ModuleType
-from unittest.mock import MagicMock
 
 import pytest
 
 # Ensure the project root is on sys.path
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
 
-import src.hooks.common as _common_module
-
 from src.hooks.common import (
     SECTION_SLUGS,
     extract_keypoints,
@@ -33,45 +28,6 @@ from src.hooks.common import (
 )
 
 
-def _setup_extract_keypoints_mocks(monkeypatch):
-    """Set up all mocks needed to call extract_keypoints() without a real LLM.
-
-    Returns the mock_client so callers can inspect calls to messages.create().
-    """
-    # Set env vars so extract_keypoints proceeds past guards
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-    monkeypatch.setenv("AGENTIC_CONTEXT_MODEL", "claude-test")
-
-    # Ensure ANTHROPIC_AVAILABLE is True
-    monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", True)
-
-    # Mock load_template to return a template with {playbook} and {trajectories}
-    monkeypatch.setattr(
-        _common_module,
-        "load_template",
-        lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
-    )
-
-    # Build mock Anthropic client
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = '{"new_key_points": [], "evaluations": []}'
-    mock_response.content = [mock_text_block]
-
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
-
-    mock_anthropic_cls = MagicMock(return_value=mock_client)
-
-    # Create a fake anthropic module with Anthropic class
-    fake_anthropic = ModuleType("anthropic")
-    setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
-    monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
-
-    return mock_client
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -568,7 +524,7 @@ def test_contract_pruning_across_sections(project_dir):
 
 
 # @tests-contract REQ-SECT-009
-def test_contract_extract_keypoints_flat_dict(monkeypatch):
+def test_contract_extract_keypoints_flat_dict(anthropic_mocks, run_async):
     """Contract: extract_keypoints builds flat {name: text} dict from all sections.
 
     Calls the actual extract_keypoints() function with a mocked Anthropic client
@@ -583,9 +539,9 @@ def test_contract_extract_keypoints_flat_dict(monkeypatch):
         ],
     })
 
-    mock_client = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, _ = anthropic_mocks
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Per contract.md: the function should call the LLM API
     mock_client.messages.create.assert_called_once()
@@ -601,13 +557,13 @@ def test_contract_extract_keypoints_flat_dict(monkeypatch):
 
 
 # @tests-contract REQ-SECT-009
-def test_contract_extract_keypoints_empty_sections(monkeypatch):
+def test_contract_extract_keypoints_empty_sections(anthropic_mocks, run_async):
     """Contract: Empty sections -> empty playbook dict sent to LLM."""
     playbook = _make_sections_playbook()
 
-    mock_client = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, _ = anthropic_mocks
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Per contract.md: the function should still call the LLM API even with empty playbook
     mock_client.messages.create.assert_called_once()
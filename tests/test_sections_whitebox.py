@@ -7,23 +7,19 @@ Covers all REQ-SECT-001 through REQ-SECT-010, all 18 SCN-SECT-* scenarios,
 all 7 INV-SECT-* invariants, and LOG-SECT-001/002/003 instrumentation tests.
 """
 
-import asyncio
 import json
 import sys
-from unittest.mock import MagicMock
-from types import ModuleType
 
 import pytest
 
 # Ensure the project root is on sys.path so we can import from src.hooks.common
 sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
 
-import src.hooks.common as _common_module
-
 from src.hooks.common import (
     SECTION_SLUGS,
     _default_playbook,
     _generate_legacy_keypoint_name,
+    _next_keypoint_name,
     _resolve_section,
     extract_keypoints,
     format_playbook,
@@ -34,45 +30,6 @@ from src.hooks.common import (
 )
 
 
-def _setup_extract_keypoints_mocks(monkeypatch):
-    """Set up all mocks needed to call extract_keypoints() without a real LLM.
-
-    Returns the mock_client so callers can inspect calls to messages.create().
-    """
-    # Set env vars so extract_keypoints proceeds past guards
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
-    monkeypatch.setenv("AGENTIC_CONTEXT_MODEL", "claude-test")
-
-    # Ensure ANTHROPIC_AVAILABLE is True
-    monkeypatch.setattr(_common_module, "ANTHROPIC_AVAILABLE", True)
-
-    # Mock load_template to return a template with {playbook} and {trajectories}
-    monkeypatch.setattr(
-        _common_module,
-        "load_template",
-        lambda name: "Trajectories: {trajectories}\nPlaybook: {playbook}",
-    )
-
-    # Build mock Anthropic client
-    mock_response = MagicMock()
-    mock_text_block = MagicMock()
-    mock_text_block.type = "text"
-    mock_text_block.text = '{"new_key_points": [], "evaluations": []}'
-    mock_response.content = [mock_text_block]
-
-    mock_client = MagicMock()
-    mock_client.messages.create.return_value = mock_response
-
-    mock_anthropic_cls = MagicMock(return_value=mock_client)
-
-    # Create a fake anthropic module with Anthropic class
-    fake_anthropic = ModuleType("anthropic")
-    setattr(fake_anthropic, "Anthropic", mock_anthropic_cls)
-    monkeypatch.setattr(_common_module, "anthropic", fake_anthropic, raising=False)
-
-    return mock_client
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -128,6 +85,9 @@ def _write_playbook(playbook_path, data):
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+_CANONICAL_SECTION_SET = frozenset(SECTION_SLUGS)
+
+
 def _make_playbook(sections_dict=None):
     """Helper to construct a sections-based playbook dict.
 
@@ -301,6 +261,34 @@ def test_generate_keypoint_name_no_name_key():
     assert result == "pat-001"
 
 
+# @tests REQ-SECT-002
+def test_next_keypoint_name_seeds_once_then_increments():
+    """_next_keypoint_name seeds from max+1 on first use, then increments per call."""
+    entries = [
+        {"name": "pat-001", "text": "a", "helpful": 0, "harmful": 0},
+        {"name": "pat-003", "text": "b", "helpful": 0, "harmful": 0},
+    ]
+    next_ids = {}
+    assert _next_keypoint_name(next_ids, "PATTERNS & APPROACHES", entries) == "pat-004"
+    # Counter is not re-derived from entries on later calls
+    assert _next_keypoint_name(next_ids, "PATTERNS & APPROACHES", []) == "pat-005"
+    # Sections have independent counters
+    assert _next_keypoint_name(next_ids, "OTHERS", []) == "oth-001"
+    assert next_ids == {"PATTERNS & APPROACHES": 6, "OTHERS": 2}
+
+
+# @tests REQ-SECT-002, REQ-SECT-005
+def test_update_playbook_data_many_new_key_points_sequential_names(project_dir):
+    """Many new_key_points in one update get contiguous names per section."""
+    playbook = _make_playbook({
+        "OTHERS": [{"name": "oth-002", "text": "existing", "helpful": 0, "harmful": 0}],
+    })
+    extraction = _make_extraction(new_key_points=[f"point {i}" for i in range(50)])
+    result = update_playbook_data(playbook, extraction)
+    names = [kp["name"] for kp in result["sections"]["OTHERS"]]
+    assert names == ["oth-002"] + [f"oth-{i:03d}" for i in range(3, 53)]
+
+
 # ===========================================================================
 # REQ-SECT-003: Formatted Output with Section Headers
 # ===========================================================================
@@ -921,7 +909,7 @@ def test_scn_pruning_removes_from_correct_section(project_dir):
 
 
 # @tests REQ-SECT-009
-def test_extract_keypoints_flat_dict(monkeypatch):
+def test_extract_keypoints_flat_dict(anthropic_mocks, run_async):
     """extract_keypoints builds flat {name: text} dict from all sections."""
     playbook = _make_playbook({
         "PATTERNS & APPROACHES": [
@@ -932,9 +920,9 @@ def test_extract_keypoints_flat_dict(monkeypatch):
         ],
     })
 
-    mock_client = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, _ = anthropic_mocks
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Verify the mock was called
     mock_client.messages.create.assert_called_once()
@@ -952,13 +940,13 @@ def test_extract_keypoints_flat_dict(monkeypatch):
 
 
 # @tests REQ-SECT-009
-def test_extract_keypoints_empty_sections(monkeypatch):
+def test_extract_keypoints_empty_sections(anthropic_mocks, run_async):
     """Empty sections -> empty playbook dict sent to LLM."""
     playbook = _make_playbook()
 
-    mock_client = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, _ = anthropic_mocks
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Verify the mock was called
     mock_client.messages.create.assert_called_once()
@@ -973,7 +961,7 @@ def test_extract_keypoints_empty_sections(monkeypatch):
 
 
 # @tests SCN-SECT-009-01
-def test_scn_extract_flat_dict_from_sections(monkeypatch):
+def test_scn_extract_flat_dict_from_sections(anthropic_mocks, run_async):
     """SCN-SECT-009-01: Flat dict from sections includes all entries."""
     playbook = _make_playbook({
         "PATTERNS & APPROACHES": [
@@ -984,9 +972,9 @@ def test_scn_extract_flat_dict_from_sections(monkeypatch):
         ],
     })
 
-    mock_client = _setup_extract_keypoints_mocks(monkeypatch)
+    mock_client, _ = anthropic_mocks
 
-    result = asyncio.run(extract_keypoints(messages=[], playbook=playbook))
+    result = run_async(extract_keypoints(messages=[], playbook=playbook))
 
     # Verify the mock was called
     mock_client.messages.create.assert_called_once()
@@ -1144,11 +1132,9 @@ def test_invariant_save_rejects_missing_sections():
 # @tests-invariant INV-SECT-002
 def test_invariant_section_names_canonical(project_dir, playbook_path):
     """After load_playbook from various formats, section names are canonical."""
-    canonical_set = set(SECTION_SLUGS.keys())
-
     # Test 1: Missing file
     playbook = load_playbook()
-    assert set(playbook["sections"].keys()) == canonical_set
+    assert set(playbook["sections"].keys()) == _CANONICAL_SECTION_SET
 
     # Test 2: Flat format
     _write_playbook(playbook_path, {
@@ -1156,7 +1142,7 @@ def test_invariant_section_names_canonical(project_dir, playbook_path):
         "key_points": [{"name": "kpt_001", "text": "a", "helpful": 0, "harmful": 0}],
     })
     playbook = load_playbook()
-    assert set(playbook["sections"].keys()) == canonical_set
+    assert set(playbook["sections"].keys()) == _CANONICAL_SECTION_SET
 
     # Test 3: Sections format missing one section
     sections_data = {name: [] for name in SECTION_SLUGS}
@@ -1166,7 +1152,7 @@ def test_invariant_section_names_canonical(project_dir, playbook_path):
         "sections": sections_data,
     })
     playbook = load_playbook()
-    assert set(playbook["sections"].keys()) == canonical_set
+    assert set(playbook["sections"].keys()) == _CANONICAL_SECTION_SET
 
 
 # ===========================================================================